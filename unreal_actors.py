@@ -2,36 +2,105 @@
 # Core functions for actor creation and manipulation
 
 import logging
-from typing import Dict, Any, List, Optional
-import json
+import uuid
+from concurrent.futures import Future
+from typing import Dict, Any, List, NamedTuple, Optional, Tuple
 
-from unreal_connection import get_unreal_connection
+from unreal_connection import UnrealConnection, get_unreal_connection
 from unreal_utils import (
     parse_kwargs, format_transform_params, get_common_actor_name,
-    validate_required_params, vector_to_ue_format, BASIC_SHAPES
+    validate_required_params, vector_to_ue_format, color_parameter, infer_actor_type,
+    encode_result, BASIC_SHAPES, DYNAMIC_COLOR_MATERIAL
 )
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, 
-                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+# Logging is configured by the entry point (unreal_mcp_server.py)
 logger = logging.getLogger("UnrealActors")
 
-def spawn_actor_base(actor_class: str, params: Dict[str, Any]) -> Optional[str]:
+class PendingSpawn(NamedTuple):
+    """A spawn started by one of the *_async functions"""
+    params: Dict[str, Any]
+    label_prefix: str  # Prefix for a generated label when params name no actor
+    future: Future
+
+class SpawnResult(NamedTuple):
+    """Outcome of a spawn collected by finish_spawning"""
+    message: str
+    params: Dict[str, Any]
+    label_prefix: str
+
+# Spawns started by the *_async functions, keyed by spawn id until collected
+_pending_spawns: Dict[str, PendingSpawn] = {}
+
+# Spawns kept for finish_spawning; beyond this the oldest finished ones (and
+# if none has finished, the oldest ones) are dropped uncollected
+_MAX_PENDING_SPAWNS = 256
+
+# Object and class paths used by the actor commands
+_EDITOR_LEVEL_LIBRARY = "/Script/EditorScriptingUtilities.Default__EditorLevelLibrary"
+_STATIC_MESH_ACTOR = "/Script/Engine.StaticMeshActor"
+_STATIC_MESH_COMPONENT = "/Script/Engine.StaticMeshComponent"
+# Name of the mesh component subobject every StaticMeshActor creates
+_STATIC_MESH_SUBOBJECT = "StaticMeshComponent0"
+
+# Scale of a freshly spawned StaticMeshActor, so setting it is skipped; other
+# classes (blueprints) may have a different default root component scale
+_UNIT_SCALE = {"X": 1.0, "Y": 1.0, "Z": 1.0}
+
+# Basic shapes keyed by both upper and lower case, so common spellings resolve
+# without normalising the mesh type first
+_SHAPE_LOOKUP = {**BASIC_SHAPES, **{shape.lower(): path for shape, path in BASIC_SHAPES.items()}}
+
+# Required parameters for each tool, in error message order
+_REQUIRED_BLUEPRINT = ('actor_class',)
+_REQUIRED_STATIC_MESH = ('static_mesh',)
+_REQUIRED_MODIFY = ('actor_label',)
+
+# Listed in the error message for an unknown mesh type
+_SUPPORTED_SHAPES = ', '.join(BASIC_SHAPES)
+
+def _resolve_mesh_type(params: Dict[str, Any]) -> Tuple[str, Optional[str]]:
+    """
+    Get the requested mesh type and the basic shape asset it maps to
+    
+    Args:
+        params: Dictionary of parameters
+        
+    Returns:
+        Tuple of (mesh_type, asset path or None if it is not a basic shape)
+    """
+    mesh_type = params.get('mesh_type') or 'CUBE'
+    if not isinstance(mesh_type, str):
+        mesh_type = str(mesh_type)
+    
+    shape_path = _SHAPE_LOOKUP.get(mesh_type)
+    if shape_path is None:
+        mesh_type = mesh_type.upper()
+        shape_path = BASIC_SHAPES.get(mesh_type)
+    
+    return mesh_type, shape_path
+
+def spawn_actor_base(actor_class: str, params: Dict[str, Any],
+                     unreal: Optional[UnrealConnection] = None,
+                     transform: Optional[Dict[str, Dict[str, float]]] = None) -> Optional[str]:
     """
     Base function to spawn an actor from any class
     
     Args:
         actor_class: Path to the actor class
         params: Dictionary of parameters
+        unreal: Connection already resolved by the caller, to avoid a second lookup
+        transform: Result of format_transform_params(params) if the caller already has it
         
     Returns:
         The actor path if successful, None otherwise
     """
     try:
-        unreal = get_unreal_connection()
+        if unreal is None:
+            unreal = get_unreal_connection()
         
         # Format transform parameters
-        transform = format_transform_params(params)
+        if transform is None:
+            transform = format_transform_params(params)
         
         # Actor name
         name = get_common_actor_name(params)
@@ -51,7 +120,7 @@ def spawn_actor_base(actor_class: str, params: Dict[str, Any]) -> Optional[str]:
         
         # Spawn the actor
         spawn_result = unreal.send_command(
-            "/Script/EditorScriptingUtilities.Default__EditorLevelLibrary",
+            _EDITOR_LEVEL_LIBRARY,
             "SpawnActorFromClass",
             spawn_params
         )
@@ -59,118 +128,233 @@ def spawn_actor_base(actor_class: str, params: Dict[str, Any]) -> Optional[str]:
         actor_path = spawn_result.get("ReturnValue", "")
         
         if not actor_path:
-            logger.error(f"Failed to spawn actor of class {actor_class}")
+            logger.error("Failed to spawn actor of class %s", actor_class)
             return None
             
-        # Set actor name
-        unreal.send_command(
-            actor_path,
-            "SetActorLabel",
-            {"NewActorLabel": name}
-        )
-        
-        # Set scale if provided
+        # Set the label and scale in a single round-trip
+        setup_commands = [(actor_path, "SetActorLabel", {"NewActorLabel": name})]
         if 'scale' in transform:
-            unreal.send_command(
-                actor_path,
-                "SetActorScale3D",
-                {"NewScale3D": transform['scale']}
-            )
-            
+            setup_commands.append((actor_path, "SetActorScale3D", {"NewScale3D": transform['scale']}))
+        for result in unreal.send_batch(setup_commands):
+            if "error" in result:
+                logger.error("Error setting up actor %s: %s", actor_path, result['error'])
+                return None
+        unreal.remember_actor(name, actor_path)
+        
         return actor_path
     except Exception as e:
-        logger.error(f"Error in spawn_actor_base: {str(e)}")
+        logger.error("Error in spawn_actor_base: %s", e)
         return None
 
 def create_static_mesh_actor(kwargs_str) -> str:
     """
     Create a new static mesh actor with a basic shape or custom mesh
     
+    Runs through the same batched steps as create_static_mesh_actors, which
+    usually takes three round-trips instead of one per remote call.
+    
     Args:
         kwargs_str: String or dict with parameters
         
     Returns:
         Success or error message
     """
+    return create_static_mesh_actors([kwargs_str])[0]
+
+class StaticMeshSpec(NamedTuple):
+    """Resolved parameters for one actor created by create_static_mesh_actors"""
+    index: int
+    name: str
+    mesh_path: str
+    transform: Dict[str, Dict[str, float]]
+    material_override: Optional[str]
+    color: Optional[List[float]]
+    location: Any
+
+def _add_mesh_commands(commands: List[Tuple[str, str, Optional[Dict[str, Any]]]],
+                       actor: StaticMeshSpec, component_path: str) -> Tuple[int, Optional[int]]:
+    """
+    Append the commands that set an actor's mesh and material to a batch
+    
+    Args:
+        commands: Batch to append to
+        actor: Actor being created
+        component_path: Path to the actor's static mesh component
+        
+    Returns:
+        Indices of the SetStaticMesh command and of the SetMaterial or
+        CreateDynamicMaterialInstance command (None when neither is sent)
+    """
+    mesh_request = len(commands)
+    commands.append((component_path, "SetStaticMesh", {"NewMesh": actor.mesh_path}))
+    
+    material_request = None
+    if actor.material_override:
+        material_request = len(commands)
+        commands.append((component_path, "SetMaterial", {"ElementIndex": 0, "Material": actor.material_override}))
+    elif actor.color:
+        material_request = len(commands)
+        commands.append((component_path, "CreateDynamicMaterialInstance", DYNAMIC_COLOR_MATERIAL))
+    return mesh_request, material_request
+
+def create_static_mesh_actors(specs: List[Any]) -> List[str]:
+    """
+    Create several static mesh actors using batched round-trips
+    
+    Each step of the creation (spawn; label, scale, mesh and material; color)
+    is sent as one batch covering every actor, so N actors cost a fixed number
+    of requests instead of several requests per actor. Actors whose mesh
+    component is not at its usual path take two more batches to look it up.
+    
+    Args:
+        specs: List of strings or dicts, each with the same parameters as
+               create_static_mesh_actor
+               
+    Returns:
+        List of success or error messages, one per spec
+    """
+    messages: List[Optional[str]] = [None] * len(specs)
+    
     try:
         unreal = get_unreal_connection()
-        params = parse_kwargs(kwargs_str)
-        
-        # Determine mesh type/path
-        mesh_type = params.get('mesh_type', 'CUBE').upper()
-        mesh_path = params.get('static_mesh_asset_path') or params.get('static_mesh')
-        
-        # If no explicit mesh path, use basic shape
-        if not mesh_path:
-            if mesh_type in BASIC_SHAPES:
-                mesh_path = BASIC_SHAPES[mesh_type]
+        actors: List[StaticMeshSpec] = []
+        
+        # Resolve meshes and transforms locally before talking to Unreal; a
+        # spec that cannot be parsed fails on its own
+        for index, spec in enumerate(specs):
+            try:
+                params = parse_kwargs(spec)
+                mesh_type, shape_path = _resolve_mesh_type(params)
+                mesh_path = params.get('static_mesh_asset_path') or params.get('static_mesh') or shape_path
+                
+                if not mesh_path:
+                    messages[index] = f"Error: Unsupported mesh type '{mesh_type}'. Supported types are: {_SUPPORTED_SHAPES}"
+                    continue
+                    
+                color = params.get('color') or params.get('material_color')
+                actors.append(StaticMeshSpec(
+                    index=index,
+                    name=get_common_actor_name(params, f"My{mesh_type.capitalize()}"),
+                    mesh_path=mesh_path,
+                    transform=format_transform_params(params),
+                    material_override=params.get('material_override'),
+                    color=color if isinstance(color, list) and len(color) >= 3 else None,
+                    location=params.get('location', [0, 0, 0])
+                ))
+            except Exception as e:
+                logger.error("Error resolving static mesh actor %s: %s", index, e)
+                messages[index] = f"Error creating static mesh actor: {str(e)}"
+                
+        if not actors:
+            return messages
+            
+        # Spawn every actor in one batch
+        spawn_commands = []
+        for actor in actors:
+            spawn_params = {"ActorClass": _STATIC_MESH_ACTOR}
+            if 'location' in actor.transform:
+                spawn_params["Location"] = actor.transform['location']
+            if 'rotation' in actor.transform:
+                spawn_params["Rotation"] = actor.transform['rotation']
+            spawn_commands.append((
+                _EDITOR_LEVEL_LIBRARY,
+                "SpawnActorFromClass",
+                spawn_params
+            ))
+            
+        spawned = []
+        for actor, result in zip(actors, unreal.send_batch(spawn_commands)):
+            actor_path = result.get("ReturnValue", "")
+            if actor_path:
+                spawned.append((actor, actor_path))
             else:
-                return f"Error: Unsupported mesh type '{mesh_type}'. Supported types are: {', '.join(BASIC_SHAPES.keys())}"
-        
-        # Get actor name
-        name = get_common_actor_name(params, f"My{mesh_type.capitalize()}")
-        
-        # Spawn the actor
-        actor_path = spawn_actor_base("/Script/Engine.StaticMeshActor", params)
-        
-        if not actor_path:
-            return "Error: Failed to spawn static mesh actor"
-        
-        # Get the StaticMeshComponent
-        component_path = unreal.get_component_by_class(
-            actor_path,
-            "/Script/Engine.StaticMeshComponent"
-        )
-        
-        if not component_path:
-            return "Error: Failed to get StaticMeshComponent"
-        
-        # Set the mesh
-        unreal.send_command(
-            component_path,
-            "SetStaticMesh",
-            {"NewMesh": mesh_path}
-        )
-        
-        # Set material/color if provided
-        material_override = params.get('material_override')
-        color = params.get('color') or params.get('material_color')
-        
-        if material_override:
-            unreal.send_command(
-                component_path,
-                "SetMaterial",
-                {"ElementIndex": 0, "Material": material_override}
-            )
-        elif color and isinstance(color, list) and len(color) >= 3:
-            # Create a dynamic material instance
-            create_mat_result = unreal.send_command(
-                component_path,
-                "CreateDynamicMaterialInstance",
-                {"ElementIndex": 0, "SourceMaterial": "/Engine/BasicShapes/BasicShapeMaterial.BasicShapeMaterial"}
-            )
+                messages[actor.index] = "Error: Failed to spawn static mesh actor"
+                
+        # Label and scale every spawned actor and set its mesh and material in
+        # the same batch; a StaticMeshActor's component is its
+        # StaticMeshComponent0 subobject, so its path is known without a lookup
+        setup_commands = []
+        setup_requests = []
+        for actor, actor_path in spawned:
+            label_request = len(setup_commands)
+            setup_commands.append((actor_path, "SetActorLabel", {"NewActorLabel": actor.name}))
+            scale_request = None
+            if actor.transform.get('scale', _UNIT_SCALE) != _UNIT_SCALE:
+                scale_request = len(setup_commands)
+                setup_commands.append((actor_path, "SetActorScale3D", {"NewScale3D": actor.transform['scale']}))
+            mesh_requests = _add_mesh_commands(setup_commands, actor, f"{actor_path}.{_STATIC_MESH_SUBOBJECT}")
+            setup_requests.append((label_request, scale_request, mesh_requests))
+            
+        setup_results = unreal.send_batch(setup_commands)
+        
+        # (actor, mesh result, material result) for every actor that got a mesh
+        # command; actors whose component has another name are retried below
+        outcomes = []
+        retry = []
+        for (actor, actor_path), (label_request, scale_request, (mesh_request, material_request)) in zip(spawned, setup_requests):
+            label_result = setup_results[label_request]
+            if "error" in label_result:
+                messages[actor.index] = f"Error setting actor label: {label_result['error']}"
+                continue
+            unreal.remember_actor(actor.name, actor_path)
             
-            material_path = create_mat_result.get("ReturnValue", "")
+            if scale_request is not None and "error" in setup_results[scale_request]:
+                messages[actor.index] = f"Error setting actor scale: {setup_results[scale_request]['error']}"
+                continue
+                
+            if "error" in setup_results[mesh_request]:
+                retry.append((actor, actor_path))
+            else:
+                material_result = setup_results[material_request] if material_request is not None else {}
+                outcomes.append((actor, setup_results[mesh_request], material_result))
+        
+        # Look up the mesh component of the retried actors, then set their
+        # meshes and materials
+        if retry:
+            component_results = unreal.send_batch([
+                (actor_path, "GetComponentByClass", {"ComponentClass": _STATIC_MESH_COMPONENT})
+                for _, actor_path in retry
+            ])
             
+            mesh_commands = []
+            retry_requests = []
+            for (actor, _), component_result in zip(retry, component_results):
+                component_path = component_result.get("ReturnValue")
+                if not component_path:
+                    messages[actor.index] = "Error: Failed to get StaticMeshComponent"
+                    continue
+                retry_requests.append((actor, _add_mesh_commands(mesh_commands, actor, component_path)))
+                
+            mesh_results = unreal.send_batch(mesh_commands)
+            for actor, (mesh_request, material_request) in retry_requests:
+                material_result = mesh_results[material_request] if material_request is not None else {}
+                outcomes.append((actor, mesh_results[mesh_request], material_result))
+        
+        # Report each actor and apply colors to the dynamic material instances
+        color_commands = []
+        colored = []
+        for actor, mesh_result, material_result in outcomes:
+            if "error" in mesh_result:
+                messages[actor.index] = f"Error setting static mesh: {mesh_result['error']}"
+                continue
+            if "error" in material_result:
+                messages[actor.index] = f"Error setting material: {material_result['error']}"
+                continue
+            messages[actor.index] = f"Successfully created {actor.name} actor at position {actor.location}"
+            
+            material_path = material_result.get("ReturnValue", "") if actor.color and not actor.material_override else ""
             if material_path:
-                # Set the color parameter - with proper RGBA format
-                color_param = {"R": color[0], "G": color[1], "B": color[2], "A": 1.0}
-                if len(color) >= 4:
-                    color_param["A"] = color[3]
-                    
-                unreal.send_command(
-                    material_path,
-                    "SetVectorParameterValue",
-                    {
-                        "ParameterName": "Color",
-                        "Value": color_param
-                    }
-                )
-        
-        return f"Successfully created {name} actor at position {params.get('location', [0, 0, 0])}"
+                colored.append(actor)
+                color_commands.append((material_path, "SetVectorParameterValue", color_parameter(actor.color)))
+                
+        for actor, color_result in zip(colored, unreal.send_batch(color_commands)):
+            if "error" in color_result:
+                messages[actor.index] = f"Error setting color: {color_result['error']}"
     except Exception as e:
-        logger.error(f"Error in create_static_mesh_actor: {str(e)}")
-        return f"Error creating static mesh actor: {str(e)}"
+        logger.error("Error in create_static_mesh_actors: %s", e)
+        messages = [m or f"Error creating static mesh actor: {str(e)}" for m in messages]
+        
+    return messages
 
 def spawn_actor_from_blueprint(kwargs_str) -> str:
     """
@@ -189,7 +373,7 @@ def spawn_actor_from_blueprint(kwargs_str) -> str:
         actor_class = params.get('actor_class') or params.get('class')
         
         # Validate required parameters
-        valid, error_msg = validate_required_params(params, ['actor_class'])
+        valid, error_msg = validate_required_params(params, _REQUIRED_BLUEPRINT)
         if not valid:
             return error_msg
             
@@ -203,7 +387,7 @@ def spawn_actor_from_blueprint(kwargs_str) -> str:
         
         return f"Successfully created actor '{name}' from blueprint class '{actor_class}'"
     except Exception as e:
-        logger.error(f"Error in spawn_actor_from_blueprint: {str(e)}")
+        logger.error("Error in spawn_actor_from_blueprint: %s", e)
         return f"Error spawning actor from blueprint: {str(e)}"
 
 def spawn_static_mesh_actor_from_mesh(kwargs_str) -> str:
@@ -223,7 +407,7 @@ def spawn_static_mesh_actor_from_mesh(kwargs_str) -> str:
         static_mesh = params.get('static_mesh') or params.get('mesh')
         
         # Validate required parameters
-        valid, error_msg = validate_required_params(params, ['static_mesh'])
+        valid, error_msg = validate_required_params(params, _REQUIRED_STATIC_MESH)
         if not valid:
             return error_msg
             
@@ -233,9 +417,83 @@ def spawn_static_mesh_actor_from_mesh(kwargs_str) -> str:
         # Use the common static mesh creation function
         return create_static_mesh_actor(params)
     except Exception as e:
-        logger.error(f"Error in spawn_static_mesh_actor_from_mesh: {str(e)}")
+        logger.error("Error in spawn_static_mesh_actor_from_mesh: %s", e)
         return f"Error spawning static mesh actor: {str(e)}"
 
+def _submit_spawn(spawn_fn, kwargs_str, label_prefix: str) -> str:
+    """
+    Run a spawn function in the background and remember it under a new spawn id
+    
+    Args:
+        spawn_fn: Spawn function taking kwargs_str and returning a message
+        kwargs_str: String or dict with parameters for spawn_fn
+        label_prefix: Prefix for a generated label when the parameters name no actor
+        
+    Returns:
+        Spawn id to pass to finish_spawning
+    """
+    if len(_pending_spawns) >= _MAX_PENDING_SPAWNS:
+        done = [pending_id for pending_id, pending in _pending_spawns.items() if pending.future.done()]
+        dropped = done or list(_pending_spawns)[:1]
+        logger.warning("Dropping %s uncollected spawn results; call finish_spawning to collect them", len(dropped))
+        for pending_id in dropped:
+            del _pending_spawns[pending_id]
+            
+    params = parse_kwargs(kwargs_str)
+    spawn_id = uuid.uuid4().hex
+    _pending_spawns[spawn_id] = PendingSpawn(params, label_prefix, get_unreal_connection().submit(spawn_fn, params))
+    return spawn_id
+
+def spawn_actor_from_blueprint_async(kwargs_str) -> str:
+    """
+    Start spawning an actor from a blueprint class without waiting for it
+    
+    Args:
+        kwargs_str: String or dict with the same parameters as spawn_actor_from_blueprint
+        
+    Returns:
+        Spawn id to pass to finish_spawning
+    """
+    return _submit_spawn(spawn_actor_from_blueprint, kwargs_str, "Actor")
+
+def spawn_static_mesh_actor_from_mesh_async(kwargs_str) -> str:
+    """
+    Start spawning a static mesh actor from a mesh asset without waiting for it
+    
+    Args:
+        kwargs_str: String or dict with the same parameters as spawn_static_mesh_actor_from_mesh
+        
+    Returns:
+        Spawn id to pass to finish_spawning
+    """
+    return _submit_spawn(spawn_static_mesh_actor_from_mesh, kwargs_str, "Mesh")
+
+def finish_spawning(spawn_id: Optional[str] = None) -> List[SpawnResult]:
+    """
+    Wait for spawns started by the *_async functions and collect their results
+    
+    Args:
+        spawn_id: Spawn id to wait for, or None to wait for every pending spawn
+        
+    Returns:
+        List of results with their success or error messages, in the order the
+        spawns were started
+    """
+    if spawn_id is None:
+        spawn_ids = list(_pending_spawns)
+    elif spawn_id in _pending_spawns:
+        spawn_ids = [spawn_id]
+    else:
+        return [SpawnResult(f"Error: Unknown spawn id '{spawn_id}'", {}, "")]
+        
+    # The spawn functions report their own errors as messages
+    results = []
+    for pending_id in spawn_ids:
+        pending = _pending_spawns.pop(pending_id, None)
+        if pending is not None:
+            results.append(SpawnResult(pending.future.result(), pending.params, pending.label_prefix))
+    return results
+
 def modify_actor(kwargs_str) -> str:
     """
     Modify an existing actor in the level
@@ -247,17 +505,18 @@ def modify_actor(kwargs_str) -> str:
         Success or error message
     """
     try:
-        unreal = get_unreal_connection()
         params = parse_kwargs(kwargs_str)
         
         # Get actor label
         actor_label = params.get('actor_label')
         
         # Validate required parameters
-        valid, error_msg = validate_required_params(params, ['actor_label'])
+        valid, error_msg = validate_required_params(params, _REQUIRED_MODIFY)
         if not valid:
             return error_msg
             
+        unreal = get_unreal_connection()
+        
         # Find the actor
         actor_path = unreal.find_actor_by_label(actor_label)
         
@@ -267,76 +526,45 @@ def modify_actor(kwargs_str) -> str:
         # Get transform parameters
         transform = format_transform_params(params)
         
-        # Apply location if provided
+        # Apply location, rotation, scale and visibility in a single round-trip
+        setter_commands = []
         if 'location' in transform:
-            unreal.send_command(
-                actor_path,
-                "SetActorLocation",
-                {"NewLocation": transform['location']}
-            )
-        
-        # Apply rotation if provided
+            setter_commands.append((actor_path, "SetActorLocation", {"NewLocation": transform['location']}))
         if 'rotation' in transform:
-            unreal.send_command(
-                actor_path,
-                "SetActorRotation",
-                {"NewRotation": transform['rotation']}
-            )
-        
-        # Apply scale if provided
+            setter_commands.append((actor_path, "SetActorRotation", {"NewRotation": transform['rotation']}))
         if 'scale' in transform:
-            unreal.send_command(
-                actor_path,
-                "SetActorScale3D",
-                {"NewScale3D": transform['scale']}
-            )
-        
-        # Set visibility if provided
+            setter_commands.append((actor_path, "SetActorScale3D", {"NewScale3D": transform['scale']}))
+            
         visible = params.get('visible')
         if visible is not None:
-            unreal.send_command(
-                actor_path,
-                "SetActorHiddenInGame",
-                {"NewHidden": not visible}
-            )
-        
-        # Set material color if provided
+            setter_commands.append((actor_path, "SetActorHiddenInGame", {"NewHidden": not visible}))
+            
+        # The static mesh component lookup for a color change doesn't depend
+        # on the setters, so unless it is cached it rides along in the same batch
         color = params.get('color') or params.get('material_color')
-        if color and isinstance(color, list) and len(color) >= 3:
-            # Get the static mesh component if it exists
-            component_path = unreal.get_component_by_class(
-                actor_path,
-                "/Script/Engine.StaticMeshComponent"
-            )
+        set_color = bool(color) and isinstance(color, list) and len(color) >= 3
+        component_path = unreal.cached_component(actor_path, _STATIC_MESH_COMPONENT) if set_color else None
+        lookup_component = set_color and not component_path
+        if lookup_component:
+            setter_commands.append((actor_path, "GetComponentByClass", {"ComponentClass": _STATIC_MESH_COMPONENT}))
             
+        results = unreal.send_batch(setter_commands)
+        for result in results[:-1] if lookup_component else results:
+            if "error" in result:
+                return f"Error modifying actor: {result['error']}"
+        
+        if lookup_component:
+            component_path = results[-1].get("ReturnValue")
             if component_path:
-                # Create a dynamic material instance
-                create_mat_result = unreal.send_command(
-                    component_path,
-                    "CreateDynamicMaterialInstance",
-                    {"ElementIndex": 0, "SourceMaterial": "/Engine/BasicShapes/BasicShapeMaterial.BasicShapeMaterial"}
-                )
+                unreal.remember_component(actor_path, _STATIC_MESH_COMPONENT, component_path)
                 
-                material_path = create_mat_result.get("ReturnValue", "")
-                
-                if material_path:
-                    # Set the color parameter - with proper RGBA format
-                    color_param = {"R": color[0], "G": color[1], "B": color[2], "A": 1.0}
-                    if len(color) >= 4:
-                        color_param["A"] = color[3]
-                        
-                    unreal.send_command(
-                        material_path,
-                        "SetVectorParameterValue",
-                        {
-                            "ParameterName": "Color",
-                            "Value": color_param
-                        }
-                    )
+        # Set material color on the static mesh component if it exists
+        if component_path and not unreal.set_component_color(component_path, color):
+            return f"Error modifying actor: Failed to set color of {actor_label}"
         
         return f"Successfully modified actor: {actor_label}"
     except Exception as e:
-        logger.error(f"Error in modify_actor: {str(e)}")
+        logger.error("Error in modify_actor: %s", e)
         return f"Error modifying actor: {str(e)}"
 
 def get_actor_info(actor_label: str) -> str:
@@ -364,144 +592,91 @@ def get_actor_info(actor_label: str) -> str:
             "label": actor_label
         }
         
-        # Get location
-        try:
-            location_result = unreal.send_command(
-                actor_path,
-                "GetActorLocation"
-            )
-            info["location"] = location_result.get("ReturnValue", {})
-        except Exception as e:
-            logger.warning(f"Could not get location for actor {actor_path}: {str(e)}")
-            info["location"] = "Not available"
-        
-        # Get rotation
-        try:
-            rotation_result = unreal.send_command(
-                actor_path,
-                "GetActorRotation"
-            )
-            info["rotation"] = rotation_result.get("ReturnValue", {})
-        except Exception as e:
-            logger.warning(f"Could not get rotation for actor {actor_path}: {str(e)}")
-            info["rotation"] = "Not available"
-        
-        # Get scale
-        try:
-            scale_result = unreal.send_command(
+        # Determine actor type from path
+        actor_type = infer_actor_type(actor_path)
+        is_static_mesh = actor_type == "StaticMeshActor"
+        
+        # Fetch transform, bounds and (for static mesh actors) the mesh
+        # component in a single batched round-trip
+        commands = [
+            (actor_path, "GetActorLocation", None),
+            (actor_path, "GetActorRotation", None),
+            (actor_path, "GetActorScale3D", None),
+            (actor_path, "GetActorBounds", {"bOnlyCollidingComponents": False})
+        ]
+        if is_static_mesh:
+            commands.append((
                 actor_path,
-                "GetActorScale3D"
-            )
-            info["scale"] = scale_result.get("ReturnValue", {})
-        except Exception as e:
-            logger.warning(f"Could not get scale for actor {actor_path}: {str(e)}")
-            info["scale"] = "Not available"
+                "GetComponentByClass",
+                {"ComponentClass": _STATIC_MESH_COMPONENT}
+            ))
+        
+        results = unreal.send_batch(commands, generate_transaction=False)
+        
+        # Get location, rotation and scale
+        for key, result in zip(("location", "rotation", "scale"), results):
+            if "error" in result:
+                logger.warning("Could not get %s for actor %s: %s", key, actor_path, result['error'])
+                info[key] = "Not available"
+            else:
+                info[key] = result.get("ReturnValue", {})
+        
+        # Get bounding box (GetActorBounds returns Origin and BoxExtent)
+        bounds_result = results[3]
+        if bounds_result and "error" not in bounds_result:
+            origin = bounds_result.get("Origin", {})
+            box_extent = bounds_result.get("BoxExtent", {})
             
-        # Get bounding box
-        try:
-            # GetActorBounds returns Origin and BoxExtent
-            bounds_result = unreal.send_command(
-                actor_path,
-                "GetActorBounds",
-                {"bOnlyCollidingComponents": False}
-            )
+            # Calculate min and max points and size of the bounding box
+            ox, oy, oz = origin.get("X", 0), origin.get("Y", 0), origin.get("Z", 0)
+            ex, ey, ez = box_extent.get("X", 0), box_extent.get("Y", 0), box_extent.get("Z", 0)
             
+            info["bounding_box"] = {
+                "origin": origin,
+                "extent": box_extent,
+                "min": {"X": ox - ex, "Y": oy - ey, "Z": oz - ez},
+                "max": {"X": ox + ex, "Y": oy + ey, "Z": oz + ez},
+                "size": {"X": ex * 2, "Y": ey * 2, "Z": ez * 2}
+            }
+        else:
             if bounds_result:
-                origin = bounds_result.get("Origin", {})
-                box_extent = bounds_result.get("BoxExtent", {})
-                
-                # Calculate min and max points of the bounding box
-                min_point = {
-                    "X": origin.get("X", 0) - box_extent.get("X", 0),
-                    "Y": origin.get("Y", 0) - box_extent.get("Y", 0),
-                    "Z": origin.get("Z", 0) - box_extent.get("Z", 0)
-                }
-                
-                max_point = {
-                    "X": origin.get("X", 0) + box_extent.get("X", 0),
-                    "Y": origin.get("Y", 0) + box_extent.get("Y", 0),
-                    "Z": origin.get("Z", 0) + box_extent.get("Z", 0)
-                }
-                
-                info["bounding_box"] = {
-                    "origin": origin,
-                    "extent": box_extent,
-                    "min": min_point,
-                    "max": max_point,
-                    "size": {
-                        "X": box_extent.get("X", 0) * 2,
-                        "Y": box_extent.get("Y", 0) * 2,
-                        "Z": box_extent.get("Z", 0) * 2
-                    }
-                }
-            else:
-                info["bounding_box"] = "Not available"
-        except Exception as e:
-            logger.warning(f"Could not get bounding box for actor {actor_path}: {str(e)}")
+                logger.warning("Could not get bounding box for actor %s: %s", actor_path, bounds_result['error'])
             info["bounding_box"] = "Not available"
         
-        # Determine actor type from path
-        actor_type = "Unknown"
-        if "StaticMeshActor" in actor_path:
-            actor_type = "StaticMeshActor"
-            
-            # If it's a static mesh actor, get mesh and material info
-            component_path = unreal.get_component_by_class(
-                actor_path,
-                "/Script/Engine.StaticMeshComponent"
-            )
+        # If it's a static mesh actor, get mesh and material info
+        if is_static_mesh:
+            component_path = results[4].get("ReturnValue")
             
             if component_path:
+                mesh_result, material_result, comp_bounds_result = unreal.send_batch([
+                    (component_path, "GetStaticMesh", None),
+                    (component_path, "GetMaterial", {"ElementIndex": 0}),
+                    (component_path, "GetBounds", None)
+                ], generate_transaction=False)
+                
                 # Get static mesh path
-                try:
-                    mesh_result = unreal.send_command(
-                        component_path,
-                        "GetStaticMesh"
-                    )
-                    info["static_mesh"] = mesh_result.get("ReturnValue", "")
-                except Exception:
+                if "error" in mesh_result:
                     info["static_mesh"] = "Not available"
+                else:
+                    info["static_mesh"] = mesh_result.get("ReturnValue", "")
                 
                 # Get material
-                try:
-                    material_result = unreal.send_command(
-                        component_path,
-                        "GetMaterial",
-                        {"ElementIndex": 0}
-                    )
-                    info["material"] = material_result.get("ReturnValue", "")
-                except Exception:
+                if "error" in material_result:
                     info["material"] = "Not available"
+                else:
+                    info["material"] = material_result.get("ReturnValue", "")
                     
                 # Get component bounds for more accurate mesh bounds
-                try:
-                    comp_bounds_result = unreal.send_command(
-                        component_path,
-                        "GetBounds"
-                    )
-                    if comp_bounds_result:
-                        bounds = comp_bounds_result.get("ReturnValue", {})
-                        info["component_bounds"] = bounds
-                except Exception as e:
-                    logger.warning(f"Could not get component bounds for {component_path}: {str(e)}")
-        elif "Light" in actor_path:
-            actor_type = "Light"
-        elif "PlayerStart" in actor_path:
-            actor_type = "PlayerStart"
-        elif "SkyAtmosphere" in actor_path:
-            actor_type = "SkyAtmosphere"
-        elif "SkyLight" in actor_path:
-            actor_type = "SkyLight"
-        elif "Fog" in actor_path:
-            actor_type = "Fog"
-        elif "VolumetricCloud" in actor_path:
-            actor_type = "VolumetricCloud"
+                if "error" in comp_bounds_result:
+                    logger.warning("Could not get component bounds for %s: %s", component_path, comp_bounds_result['error'])
+                elif comp_bounds_result:
+                    info["component_bounds"] = comp_bounds_result.get("ReturnValue", {})
         
         info["type"] = actor_type
         
-        return json.dumps(info, indent=2)
+        return encode_result(info)
     except Exception as e:
-        logger.error(f"Error in get_actor_info: {str(e)}")
+        logger.error("Error in get_actor_info: %s", e)
         return f"Error getting actor info: {str(e)}"
 
 def delete_actor(actor_label: str) -> str:
@@ -529,7 +704,8 @@ def delete_actor(actor_label: str) -> str:
             "DestroyActor",
             {"ActorTarget": actor_path}
         )
+        unreal.forget_actor(actor_path)
         
     except Exception as e:
-        logger.error(f"Error in delete_actor: {str(e)}")
+        logger.error("Error in delete_actor: %s", e)
         return f"Error deleting actor: {str(e)}"
\ No newline at end of file
@@ -1,20 +1,48 @@
 # unreal_assets.py
 # Functions for working with Unreal Engine assets
 
+import functools
 import logging
-import json
-from typing import Dict, Any, List, Optional
+import re
+import time
+from typing import Dict, Any, List, Optional, Tuple
 
 from unreal_connection import get_unreal_connection
 from unreal_utils import (
-    parse_kwargs, COMMON_SUBDIRS, ASSET_TYPE_IDENTIFIERS
+    parse_kwargs, infer_actor_type, encode_result,
+    EDITOR_ACTOR_SUBSYSTEM, EDITOR_ASSET_LIBRARY, COMMON_SUBDIRS, ASSET_TYPE_PATTERNS
 )
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, 
-                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+# Logging is configured by the entry point (unreal_mcp_server.py)
 logger = logging.getLogger("UnrealAssets")
 
+# Seconds a directory listing is reused before Unreal Engine is asked again
+_LISTING_TTL = 10
+
+@functools.lru_cache(maxsize=256)
+def _list_assets(search_path: str, recursive: bool, epoch: int) -> Tuple[str, ...]:
+    """
+    List the assets in a directory, reusing the answer within one cache epoch
+    
+    Args:
+        search_path: Directory to list
+        recursive: Whether to include subdirectories
+        epoch: Current time bucket; a new bucket forces a fresh listing
+        
+    Returns:
+        Tuple of asset paths (failures raise and are not cached)
+    """
+    list_assets_result = get_unreal_connection().send_command(
+        EDITOR_ASSET_LIBRARY,
+        "ListAssets",
+        {
+            "DirectoryPath": search_path,
+            "Recursive": recursive,
+            "IncludeFolder": True
+        }
+    )
+    return tuple(list_assets_result.get("ReturnValue", []))
+
 def get_available_assets(kwargs_str) -> str:
     """
     Get a list of available assets of a specific type in the project
@@ -31,142 +59,77 @@ def get_available_assets(kwargs_str) -> str:
         JSON string with matching assets
     """
     try:
-        unreal = get_unreal_connection()
-        params = parse_kwargs(kwargs_str)
+        result = _get_available_assets_impl(parse_kwargs(kwargs_str))
+        return encode_result(result)
+    except Exception as e:
+        logger.error("Error getting available assets: %s", e)
+        return f"Error getting available assets: {str(e)}"
+
+def _get_available_assets_impl(params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Find available assets for already parsed parameters
+    
+    Args:
+        params: Dictionary with the parameters described in get_available_assets
         
-        # Get parameters
-        asset_type = params.get('asset_type', 'All').lower()
-        search_path = params.get('search_path', '/Game')
-        search_term = params.get('search_term', '')
-        max_results = params.get('max_results', 20)
-        recursive = params.get('recursive', True)
+    Returns:
+        Dictionary with the query and the matching assets
         
-        # Convert string boolean to actual boolean if needed
-        if isinstance(recursive, str):
-            recursive = recursive.lower() == 'true'
+    Raises:
+        Exception: If the assets could not be listed
+    """
+    # Get parameters
+    asset_type = params.get('asset_type', 'All').lower()
+    search_path = params.get('search_path', '/Game')
+    search_term = params.get('search_term', '')
+    max_results = params.get('max_results', 20)
+    recursive = params.get('recursive', True)
+    
+    # Convert string boolean to actual boolean if needed
+    if isinstance(recursive, str):
+        recursive = recursive.lower() == 'true'
+    
+    # Compiled case-insensitive matchers for the requested type and search
+    # term (None matches every asset)
+    type_pattern = ASSET_TYPE_PATTERNS.get(asset_type)
+    term_pattern = re.compile(re.escape(str(search_term)), re.IGNORECASE) if search_term else None
+    
+    # Get assets in the specified path using the EditorAssetLibrary
+    assets = _list_assets(search_path, recursive, int(time.monotonic() // _LISTING_TTL))
+    logger.info("Found %s total assets in %s", len(assets), search_path)
+    
+    # Filter assets by type and search term
+    filtered_assets = []
+    
+    for asset_path in assets:
+        # Stop if we've reached the max results
+        if len(filtered_assets) >= max_results:
+            break
         
-        # Use the EditorAssetLibrary to get available assets
-        try:
-            # Get assets in the specified path
-            list_assets_result = unreal.send_command(
-                "/Script/EditorScriptingUtilities.Default__EditorAssetLibrary",
-                "ListAssets",
-                {
-                    "DirectoryPath": search_path,
-                    "Recursive": recursive,
-                    "IncludeFolder": True
-                }
-            )
-            
-            assets = list_assets_result.get("ReturnValue", [])
-            logger.info(f"Found {len(assets)} total assets in {search_path}")
-            
-            # Filter assets by type and search term
-            filtered_assets = []
-            
-            for asset_path in assets:
-                # Skip if empty
-                if not asset_path:
-                    continue
-                
-                # Path lowercase for case-insensitive matching
-                asset_path_lower = asset_path.lower()
-                
-                # Check asset type if specified
-                asset_type_match = True
-                if asset_type != 'all' and asset_type in ASSET_TYPE_IDENTIFIERS:
-                    identifiers = ASSET_TYPE_IDENTIFIERS[asset_type]
-                    # Check if any of the type identifiers exist in the path
-                    if not any(identifier in asset_path_lower for identifier in identifiers):
-                        asset_type_match = False
-                
-                # Check for search term match if specified
-                search_term_match = True
-                if search_term and search_term.lower() not in asset_path_lower:
-                    search_term_match = False
-                
-                # Add asset to filtered list if it matches all criteria
-                if asset_type_match and search_term_match:
-                    filtered_assets.append(asset_path)
-                
-                # Stop if we've reached the max results
-                if len(filtered_assets) >= max_results:
-                    break
-            
-            # Prepare the response
-            result = {
-                "asset_type": asset_type.capitalize() if asset_type != 'all' else "All",
-                "search_path": search_path,
-                "search_term": search_term,
-                "total_found": len(filtered_assets),
-                "assets": filtered_assets
-            }
-            
-            return json.dumps(result, indent=2)
+        # Skip if empty
+        if not asset_path:
+            continue
         
-        except Exception as e:
-            logger.error(f"Error using EditorAssetLibrary: {str(e)}")
-            
-            # Fall back to a different approach - try using GetAssetsByPath
-            try:
-                # Alternative approach
-                get_assets_result = unreal.send_command(
-                    "/Script/EditorScriptingUtilities.Default__EditorAssetLibrary",
-                    "GetAssetsByPath",
-                    {
-                        "DirectoryPath": search_path,
-                        "Recursive": recursive,
-                        "IncludeFolder": True
-                    }
-                )
-                
-                assets = get_assets_result.get("ReturnValue", [])
-                
-                # Filter assets as before
-                filtered_assets = []
-                for asset_path in assets:
-                    if not asset_path:
-                        continue
-                    
-                    asset_path_lower = asset_path.lower()
-                    
-                    # Check asset type
-                    asset_type_match = True
-                    if asset_type != 'all' and asset_type in ASSET_TYPE_IDENTIFIERS:
-                        identifiers = ASSET_TYPE_IDENTIFIERS[asset_type]
-                        if not any(identifier in asset_path_lower for identifier in identifiers):
-                            asset_type_match = False
-                    
-                    # Check search term
-                    search_term_match = True
-                    if search_term and search_term.lower() not in asset_path_lower:
-                        search_term_match = False
-                    
-                    # Add to filtered list if matching
-                    if asset_type_match and search_term_match:
-                        filtered_assets.append(asset_path)
-                    
-                    # Check max results
-                    if len(filtered_assets) >= max_results:
-                        break
-                
-                result = {
-                    "asset_type": asset_type.capitalize() if asset_type != 'all' else "All",
-                    "search_path": search_path,
-                    "search_term": search_term,
-                    "total_found": len(filtered_assets),
-                    "assets": filtered_assets
-                }
-                
-                return json.dumps(result, indent=2)
-                
-            except Exception as e2:
-                logger.error(f"Alternative approach also failed: {str(e2)}")
-                return f"Error listing assets: {str(e)}. Alternative approach also failed: {str(e2)}"
-            
-    except Exception as e:
-        logger.error(f"Error getting available assets: {str(e)}")
-        return f"Error getting available assets: {str(e)}"
+        # Check for search term match if specified; a single term is cheaper
+        # to test than the alternatives of a type pattern
+        if term_pattern is not None and not term_pattern.search(asset_path):
+            continue
+        
+        # Check asset type if specified
+        if type_pattern is not None and not type_pattern.search(asset_path):
+            continue
+        
+        # Add asset to filtered list as it matches all criteria
+        filtered_assets.append(asset_path)
+    
+    # Prepare the response
+    return {
+        "asset_type": asset_type.capitalize() if asset_type != 'all' else "All",
+        "search_path": search_path,
+        "search_term": search_term,
+        "total_found": len(filtered_assets),
+        "assets": filtered_assets
+    }
 
 def search_assets_recursively(base_path: str, asset_type: str = None, search_term: str = None, max_results: int = 50) -> str:
     """
@@ -181,46 +144,43 @@ def search_assets_recursively(base_path: str, asset_type: str = None, search_ter
     Returns:
         JSON string with matched assets
     """
-    # Prepare kwargs for each search
+    # Parameters shared by each search
+    params = {}
     if asset_type:
-        asset_type_param = f"asset_type={asset_type} "
-    else:
-        asset_type_param = ""
-        
+        params['asset_type'] = asset_type
     if search_term:
-        search_term_param = f"search_term={search_term} "
-    else:
-        search_term_param = ""
+        params['search_term'] = search_term
         
-    max_results_param = f"max_results={max_results}"
+    # Combined assets from all subdirectories, without duplicates and in
+    # order of first appearance
+    found_paths: Dict[str, None] = {}
     
-    # Combined assets from all subdirectories
-    all_assets = []
-    
-    # Search in each subdirectory
+    # Search in each subdirectory, stopping once enough assets are found
     for subdir in COMMON_SUBDIRS:
+        remaining = max_results - len(found_paths)
+        if remaining <= 0:
+            break
+            
         search_path = f"{base_path}{subdir}"
-        kwargs_str = f"{asset_type_param}search_path={search_path} {search_term_param}{max_results_param}"
         
         try:
             # Get assets in this subdirectory
-            result_str = get_available_assets(kwargs_str)
-            result = json.loads(result_str)
+            result = _get_available_assets_impl({**params, 'search_path': search_path, 'max_results': remaining})
             
             # Add assets to the combined list
-            if result and "assets" in result:
-                found_assets = result.get("assets", [])
-                all_assets.extend(found_assets)
-                logger.info(f"Found {len(found_assets)} assets in {search_path}")
+            found_assets = result["assets"]
+            found_paths.update(dict.fromkeys(found_assets))
+            logger.info("Found %s assets in %s", len(found_assets), search_path)
+            
+            # Searches are recursive, so a complete answer for the base directory
+            # already covers every subdirectory below it
+            if not subdir and len(found_assets) < remaining:
+                break
         except Exception as e:
-            logger.warning(f"Error searching in {search_path}: {str(e)}")
+            logger.warning("Error searching in %s: %s", search_path, e)
             continue
     
-    # Remove duplicates while preserving order
-    unique_assets = []
-    for asset in all_assets:
-        if asset not in unique_assets:
-            unique_assets.append(asset)
+    unique_assets = list(found_paths)
     
     # Prepare the combined result
     combined_result = {
@@ -231,7 +191,7 @@ def search_assets_recursively(base_path: str, asset_type: str = None, search_ter
         "assets": unique_assets[:max_results]  # Limit to max_results
     }
     
-    return json.dumps(combined_result, indent=2)
+    return encode_result(combined_result)
 
 def get_level_info() -> str:
     """
@@ -245,70 +205,57 @@ def get_level_info() -> str:
         
         # Get all level actors
         actors_result = unreal.send_command(
-            "/Script/UnrealEd.Default__EditorActorSubsystem",
+            EDITOR_ACTOR_SUBSYSTEM,
             "GetAllLevelActors"
         )
         
         actors = actors_result.get("ReturnValue", [])
         
+        # Fetch every actor's label and location in a single batched round-trip
+        commands = []
+        for actor_path in actors:
+            commands.append((actor_path, "GetActorLabel", None))
+            commands.append((actor_path, "GetActorLocation", None))
+        results = unreal.send_batch(commands, generate_transaction=False)
+        
+        # The labels below describe the whole current level, so they replace
+        # whatever was cached before (possibly for another level)
+        unreal.clear_label_cache()
+        
         # Get details for each actor
         actors_info = []
         
-        for actor_path in actors:
+        for index, actor_path in enumerate(actors):
             try:
                 # Store basic info
                 actor_info = {
                     "path": actor_path
                 }
                 
-                # Try to get actor label
-                try:
-                    label_result = unreal.send_command(
-                        actor_path,
-                        "GetActorLabel"
-                    )
+                # Get actor label, extracting the name from the path as a fallback
+                label_result = results[2 * index]
+                if "error" in label_result:
+                    logger.warning("Could not get label for actor %s: %s", actor_path, label_result['error'])
+                    actor_info["label"] = actor_path.split('.')[-1] or "Unknown"
+                else:
                     actor_info["label"] = label_result.get("ReturnValue", "Unknown")
-                except Exception as e:
-                    logger.warning(f"Could not get label for actor {actor_path}: {str(e)}")
-                    # Extract name from path as fallback
-                    try:
-                        actor_info["label"] = actor_path.split('.')[-1]
-                    except:
-                        actor_info["label"] = "Unknown"
+                    if label_result.get("ReturnValue"):
+                        unreal.remember_actor(actor_info["label"], actor_path, replace=False)
                 
-                # Try to get actor location
-                try:
-                    location_result = unreal.send_command(
-                        actor_path,
-                        "GetActorLocation"
-                    )
-                    actor_info["location"] = location_result.get("ReturnValue", {})
-                except Exception as e:
-                    logger.warning(f"Could not get location for actor {actor_path}: {str(e)}")
+                # Get actor location
+                location_result = results[2 * index + 1]
+                if "error" in location_result:
+                    logger.warning("Could not get location for actor %s: %s", actor_path, location_result['error'])
                     actor_info["location"] = "Unknown"
+                else:
+                    actor_info["location"] = location_result.get("ReturnValue", {})
                 
                 # Infer type from the path
-                actor_type = "Unknown"
-                if "StaticMeshActor" in actor_path:
-                    actor_type = "StaticMeshActor"
-                elif "Light" in actor_path:
-                    actor_type = "Light"
-                elif "PlayerStart" in actor_path:
-                    actor_type = "PlayerStart"
-                elif "SkyAtmosphere" in actor_path:
-                    actor_type = "SkyAtmosphere"
-                elif "SkyLight" in actor_path:
-                    actor_type = "SkyLight"
-                elif "Fog" in actor_path:
-                    actor_type = "Fog"
-                elif "VolumetricCloud" in actor_path:
-                    actor_type = "VolumetricCloud"
-                
-                actor_info["type"] = actor_type
+                actor_info["type"] = infer_actor_type(actor_path)
                 
                 actors_info.append(actor_info)
             except Exception as e:
-                logger.warning(f"Error getting details for actor {actor_path}: {str(e)}")
+                logger.warning("Error getting details for actor %s: %s", actor_path, e)
                 actors_info.append({"path": actor_path, "error": str(e)})
         
         # Get current level info
@@ -321,7 +268,7 @@ def get_level_info() -> str:
                     map_part = path_parts[0]
                     level_name = map_part.split('.')[-1]
             except Exception as e:
-                logger.warning(f"Error extracting level name: {str(e)}")
+                logger.warning("Error extracting level name: %s", e)
         
         # Compile level info
         level_info = {
@@ -330,7 +277,7 @@ def get_level_info() -> str:
             "actors": actors_info
         }
         
-        return json.dumps(level_info, indent=2)
+        return encode_result(level_info)
     except Exception as e:
-        logger.error(f"Error getting level info: {str(e)}")
+        logger.error("Error getting level info: %s", e)
         return f"Error getting level info: {str(e)}"
\ No newline at end of file
@@ -2,37 +2,101 @@
 # Handles connection and communication with Unreal Engine
 
 import logging
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 import requests
-from typing import Dict, Any, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+from typing import Dict, Any, List, Optional, Tuple
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, 
-                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+from unreal_utils import (
+    encode_json, decode_json, color_parameter, DYNAMIC_COLOR_MATERIAL, EDITOR_ACTOR_SUBSYSTEM
+)
+
+# Logging is configured by the entry point (unreal_mcp_server.py)
 logger = logging.getLogger("UnrealConnection")
 
+# Payloads are encoded by encode_json, so the content type is set explicitly
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Worker threads that overlap independent commands when they can't be batched
+_COMMAND_WORKERS = 8
+_command_pool = ThreadPoolExecutor(max_workers=_COMMAND_WORKERS, thread_name_prefix="UnrealCommand")
+
+# Worker threads for operations the caller collects later; kept apart from
+# _command_pool so a queued operation never waits on its own pool
+_TASK_WORKERS = 4
+_task_pool = ThreadPoolExecutor(max_workers=_TASK_WORKERS, thread_name_prefix="UnrealTask")
+
+# Seconds after a successful call during which the connection is trusted
+# without another probe
+_LIVENESS_TTL = 30.0
+
+# Liveness probe: a call whose response has the same small size however
+# large the level is, unlike listing the level's actors
+_PROBE_PAYLOAD = encode_json({
+    "objectPath": "/Script/Engine.Default__KismetSystemLibrary",
+    "functionName": "GetEngineVersion",
+    "generateTransaction": False
+})
+
+# Attempts for a request whose connection could not be established, with
+# exponential backoff (seconds) and +/- jitter (fraction of the backoff)
+_RETRY_ATTEMPTS = 3
+_RETRY_BACKOFF = 0.05
+_RETRY_JITTER = 0.1
+
+# Consecutive failed requests after which further requests fail immediately,
+# and for how many seconds
+_BREAKER_THRESHOLD = 5
+_BREAKER_RESET = 30.0
+
+# Upper bound on cached label and component lookups before a cache is reset
+_LOOKUP_CACHE_SIZE = 4096
+
 class UnrealConnection:
     """Class to manage connection to Unreal Engine Remote Control API"""
     def __init__(self, host: str = "127.0.0.1", port: int = 30010):
         self.host = host
         self.port = port
         self.base_url = f"http://{host}:{port}/remote/object/call"
+        self.batch_url = f"http://{host}:{port}/remote/batch"
+        # Cleared if the Remote Control batch endpoint turns out to be unavailable
+        self.batch_supported = True
+        # Keep-alive session so commands reuse TCP connections; the pool is
+        # sized for every worker thread to hold one at once
+        self.session = requests.Session()
+        self.session.headers.update(_JSON_HEADERS)
+        self.session.mount("http://", HTTPAdapter(pool_maxsize=_COMMAND_WORKERS + _TASK_WORKERS))
+        # time.monotonic() of the last successful call, 0.0 if none or after a failure
+        self.last_success = 0.0
+        # Circuit breaker: requests fail fast until _breaker_open_until after
+        # _BREAKER_THRESHOLD consecutive failures
+        self._consecutive_failures = 0
+        self._breaker_open_until = 0.0
+        # Label -> actor path; labels can change in the editor, so hits are re-checked
+        self._label_cache: Dict[str, str] = {}
+        # A component's path never changes while its actor exists
+        self._component_cache: Dict[Tuple[str, str], str] = {}
     
     def test_connection(self) -> bool:
         """Test connection to Unreal Engine Remote Control API"""
         try:
-            # Get all level actors as a simple test
-            payload = {
-                "objectPath": "/Script/UnrealEd.Default__EditorActorSubsystem",
-                "functionName": "GetAllLevelActors"
-            }
-            
-            response = requests.put(self.base_url, json=payload, timeout=5)
+            # Only the status matters, so the small response body is not decoded
+            response = self.session.put(self.base_url, data=_PROBE_PAYLOAD, timeout=5)
             response.raise_for_status()
             
-            logger.info(f"Successfully connected to Unreal Engine at {self.host}:{self.port}")
+            logger.info("Successfully connected to Unreal Engine at %s:%s", self.host, self.port)
+            self.last_success = time.monotonic()
+            
+            # The probe bypasses the circuit breaker, so it is what closes it again
+            self._consecutive_failures = 0
+            self._breaker_open_until = 0.0
             return True
         except Exception as e:
-            logger.error(f"Failed to connect to Unreal Engine: {str(e)}")
+            logger.error("Failed to connect to Unreal Engine: %s", e)
             return False
     
     def send_command(self, 
@@ -63,29 +127,202 @@ class UnrealConnection:
         }
         
         try:
-            # Log the command being sent
-            if parameters:
-                logger.info(f"Sending UE command: {function_name} with params: {parameters}")
-            else:
-                logger.info(f"Sending UE command: {function_name}")
+            # Log the command being sent; the parameter dump is only formatted at DEBUG level
+            logger.info("Sending UE command: %s", function_name)
+            if parameters and logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Command %s params: %s", function_name, parameters)
             
             # Send the command
-            response = requests.put(self.base_url, json=payload, timeout=10)
+            response = self._put(self.base_url, encode_json(payload), timeout=10)
             response.raise_for_status()
             
-            result = response.json()
-            logger.info(f"Command successful: {function_name}")
+            result = decode_json(response.content)
+            logger.info("Command successful: %s", function_name)
+            self.last_success = time.monotonic()
             
             return result
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Error sending command to Unreal Engine: {str(e)}")
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logger.error("Error sending command to Unreal Engine: %s", e)
             if hasattr(e, 'response') and e.response:
-                logger.error(f"Response details: {e.response.text}")
+                logger.error("Response details: %s", e.response.text)
+            self.last_success = 0.0
             raise Exception(f"Communication error with Unreal Engine: {str(e)}")
         except Exception as e:
-            logger.error(f"Unexpected error: {str(e)}")
+            logger.error("Unexpected error: %s", e)
             raise Exception(f"Unexpected error: {str(e)}")
 
+    def _put(self, url: str, data: bytes, timeout: float) -> requests.Response:
+        """
+        PUT a request body to Unreal Engine with retries and a circuit breaker
+        
+        Only attempts that failed to connect are retried: once a request has
+        been sent Unreal Engine may have run it, and commands such as spawns
+        must not run twice. After repeated failures the breaker opens and
+        requests fail immediately until it resets or a probe succeeds.
+        
+        Args:
+            url: Remote Control endpoint
+            data: Encoded JSON body
+            timeout: Seconds to wait for each attempt
+            
+        Returns:
+            The HTTP response, whatever its status code
+            
+        Raises:
+            requests.exceptions.RequestException: If no response was received
+        """
+        if time.monotonic() < self._breaker_open_until:
+            raise requests.exceptions.ConnectionError("Unreal Engine is unreachable, not retrying until the circuit breaker resets")
+            
+        backoff = _RETRY_BACKOFF
+        for attempt in range(1, _RETRY_ATTEMPTS + 1):
+            try:
+                response = self.session.put(url, data=data, timeout=timeout)
+            except requests.exceptions.RequestException as e:
+                if attempt < _RETRY_ATTEMPTS and _is_connect_failure(e):
+                    logger.warning("Could not connect to Unreal Engine (attempt %s of %s), retrying", attempt, _RETRY_ATTEMPTS)
+                    time.sleep(backoff + random.uniform(-_RETRY_JITTER, _RETRY_JITTER) * backoff)
+                    backoff *= 2
+                    continue
+                    
+                self._consecutive_failures += 1
+                if self._consecutive_failures >= _BREAKER_THRESHOLD:
+                    logger.warning("Unreal Engine failed %s requests in a row, failing fast for %s s",
+                                   self._consecutive_failures, _BREAKER_RESET)
+                    self._breaker_open_until = time.monotonic() + _BREAKER_RESET
+                raise
+                
+            # Any response, even an HTTP error, shows Unreal Engine is reachable
+            self._consecutive_failures = 0
+            return response
+    
+    def submit(self, fn, *args, **kwargs) -> Future:
+        """
+        Run a function that talks to Unreal Engine in the background
+        
+        Args:
+            fn: Function to run
+            *args, **kwargs: Arguments passed to fn
+            
+        Returns:
+            Future resolving to the function's return value
+        """
+        return _task_pool.submit(fn, *args, **kwargs)
+
+    def send_batch(self,
+                   commands: List[Tuple[str, str, Optional[Dict[str, Any]]]],
+                   generate_transaction: bool = True) -> List[Dict[str, Any]]:
+        """
+        Send several commands to Unreal Engine in a single request
+        
+        Uses the Remote Control batch endpoint so that N calls cost one
+        round-trip instead of N. If the endpoint is not available the commands
+        are sent individually, overlapping commands on different objects.
+        Commands on the same object always run in the given order.
+        
+        Args:
+            commands: List of (object_path, function_name, parameters) tuples
+            generate_transaction: Whether to generate a transaction for undo
+            
+        Returns:
+            List of responses in the same order as commands. A call that failed
+            is returned as {"error": message} instead of raising.
+            
+        Raises:
+            Exception: If the batch request itself cannot be delivered
+        """
+        if not commands:
+            return []
+        
+        if not self.batch_supported:
+            return self._send_unbatched(commands, generate_transaction)
+        
+        payload = {
+            "Requests": [
+                {
+                    "RequestId": i,
+                    "URL": "/remote/object/call",
+                    "Verb": "PUT",
+                    "Body": {
+                        "objectPath": object_path,
+                        "functionName": function_name,
+                        "parameters": parameters or {},
+                        "generateTransaction": generate_transaction
+                    }
+                }
+                for i, (object_path, function_name, parameters) in enumerate(commands)
+            ]
+        }
+        
+        try:
+            logger.info("Sending UE batch of %s commands", len(commands))
+            response = self._put(self.batch_url, encode_json(payload), timeout=10)
+            
+            # Older engine versions don't expose the batch endpoint
+            if response.status_code in (404, 405, 501):
+                logger.warning("Remote Control batch endpoint not available, sending commands one by one")
+                self.batch_supported = False
+                return self._send_unbatched(commands, generate_transaction)
+                
+            # A rejected batch ran nothing; sending this one's commands
+            # individually reports which of them is at fault
+            if response.status_code == 400:
+                logger.warning("Remote Control rejected the batch, sending its commands one by one")
+                return self._send_unbatched(commands, generate_transaction)
+            
+            response.raise_for_status()
+            responses = decode_json(response.content).get("Responses", [])
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logger.error("Error sending batch to Unreal Engine: %s", e)
+            self.last_success = 0.0
+            raise Exception(f"Communication error with Unreal Engine: {str(e)}")
+        
+        # Responses are matched back by RequestId, not by position
+        results: List[Dict[str, Any]] = [{"error": "No response for command"} for _ in commands]
+        for entry in responses:
+            request_id = entry.get("RequestId")
+            if not isinstance(request_id, int) or not 0 <= request_id < len(commands):
+                continue
+            
+            body = entry.get("ResponseBody")
+            if entry.get("ResponseCode", 200) == 200:
+                results[request_id] = body if isinstance(body, dict) else {}
+            else:
+                function_name = commands[request_id][1]
+                logger.warning("Batched command %s failed: %s", function_name, body)
+                results[request_id] = {"error": str(body)}
+        
+        logger.info("Batch successful: %s commands", len(commands))
+        self.last_success = time.monotonic()
+        return results
+    
+    def _send_unbatched(self,
+                        commands: List[Tuple[str, str, Optional[Dict[str, Any]]]],
+                        generate_transaction: bool) -> List[Dict[str, Any]]:
+        """Send commands individually, with the same result shape as send_batch"""
+        # Group by target object so that per-object ordering is preserved
+        groups: Dict[str, List[int]] = {}
+        for index, (object_path, _, _) in enumerate(commands):
+            groups.setdefault(object_path, []).append(index)
+        
+        results: List[Dict[str, Any]] = [{} for _ in commands]
+        
+        def run_group(indices: List[int]) -> None:
+            for index in indices:
+                object_path, function_name, parameters = commands[index]
+                try:
+                    results[index] = self.send_command(object_path, function_name, parameters, generate_transaction)
+                except Exception as e:
+                    results[index] = {"error": str(e)}
+        
+        if len(groups) == 1:
+            run_group(next(iter(groups.values())))
+        else:
+            # Different objects are independent, so their round-trips can overlap
+            list(_command_pool.map(run_group, groups.values()))
+        
+        return results
+
     def find_actor_by_label(self, actor_label: str) -> Optional[str]:
         """
         Find an actor by its label and return its path
@@ -96,36 +333,80 @@ class UnrealConnection:
         Returns:
             The actor path if found, None otherwise
         """
+        # A cached path costs one label check instead of a scan of the level
+        cached = self._label_cache.get(actor_label)
+        if cached:
+            try:
+                if self.send_command(cached, "GetActorLabel").get("ReturnValue") == actor_label:
+                    return cached
+            except Exception:
+                pass
+            self._label_cache.pop(actor_label, None)
+            
         try:
             # Get all actors
             actors_result = self.send_command(
-                "/Script/UnrealEd.Default__EditorActorSubsystem",
+                EDITOR_ACTOR_SUBSYSTEM,
                 "GetAllLevelActors"
             )
             
             actors = actors_result.get("ReturnValue", [])
             
-            # Find the actor with the matching label
-            for path in actors:
-                try:
-                    label_result = self.send_command(
-                        path,
-                        "GetActorLabel"
-                    )
-                    label = label_result.get("ReturnValue", "")
-                    
-                    if label == actor_label:
-                        return path
-                except Exception:
-                    # If GetActorLabel fails, try to check if the actor name in the path matches
-                    if actor_label in path:
-                        return path
+            # Actor names usually carry the label (PersistentLevel.MyCube_1), so
+            # check those candidates first. Labels can repeat and the first
+            # match in level order wins, so the other actors are then checked
+            # only up to the candidate found, or all of them on a miss
+            candidates = [path for path in actors if actor_label in path.rsplit('.', 1)[-1]]
+            match = self._match_label(actor_label, candidates) if candidates else None
+            candidate_set = set(candidates)
+            earlier = actors[:actors.index(match)] if match is not None else actors
+            rest = [path for path in earlier if path not in candidate_set]
+            if rest:
+                match = self._match_label(actor_label, rest) or match
             
-            return None
+            return match
         except Exception as e:
-            logger.error(f"Error finding actor by label: {str(e)}")
+            logger.error("Error finding actor by label: %s", e)
             return None
-
+            
+    def _match_label(self, actor_label: str, actors: List[str]) -> Optional[str]:
+        """
+        Find the actor with the given label among some actors
+        
+        Args:
+            actor_label: The label of the actor to find
+            actors: Paths of the actors to check
+            
+        Returns:
+            The first matching actor path, None if there is none
+        """
+        # Fetch the labels in one batched round-trip instead of one request
+        # per actor
+        label_results = self.send_batch(
+            [(path, "GetActorLabel", None) for path in actors],
+            generate_transaction=False
+        )
+        
+        # Find the first actor with the matching label
+        match = None
+        for path, label_result in zip(actors, label_results):
+            if "error" in label_result:
+                # If GetActorLabel fails, try to check if the actor name in the path matches
+                if match is None and actor_label in path:
+                    match = path
+                continue
+                
+            label = label_result.get("ReturnValue", "")
+            
+            # Remember every label seen so later lookups can skip the scan
+            if label:
+                self.remember_actor(label, path, replace=False)
+            if match is None and label == actor_label:
+                self.remember_actor(label, path)
+                match = path
+        
+        return match
+        
     def get_component_by_class(self, actor_path: str, component_class: str) -> Optional[str]:
         """
         Get a component by its class from an actor
@@ -137,6 +418,10 @@ class UnrealConnection:
         Returns:
             The component path if found, None otherwise
         """
+        cached = self.cached_component(actor_path, component_class)
+        if cached:
+            return cached
+            
         try:
             result = self.send_command(
                 actor_path,
@@ -144,35 +429,168 @@ class UnrealConnection:
                 {"ComponentClass": component_class}
             )
             
-            return result.get("ReturnValue")
+            component_path = result.get("ReturnValue")
+            if component_path:
+                self.remember_component(actor_path, component_class, component_path)
+            return component_path
         except Exception as e:
-            logger.error(f"Error getting component: {str(e)}")
+            logger.error("Error getting component: %s", e)
             return None
+            
+    def cached_component(self, actor_path: str, component_class: str) -> Optional[str]:
+        """
+        Get a component path found by an earlier lookup, without asking Unreal Engine
+        
+        Args:
+            actor_path: Path to the actor
+            component_class: Class of the component
+            
+        Returns:
+            The cached component path, None if it is not known
+        """
+        return self._component_cache.get((actor_path, component_class))
+        
+    def remember_component(self, actor_path: str, component_class: str, component_path: str) -> None:
+        """
+        Record the component of an actor found by a lookup made elsewhere, e.g. in a batch
+        
+        Args:
+            actor_path: Path to the actor
+            component_class: Class of the component
+            component_path: Path to the component
+        """
+        if len(self._component_cache) >= _LOOKUP_CACHE_SIZE:
+            self._component_cache.clear()
+        self._component_cache[(actor_path, component_class)] = component_path
+        
+    def remember_actor(self, actor_label: str, actor_path: str, replace: bool = True) -> None:
+        """
+        Record the path of an actor with a known label for find_actor_by_label
+        
+        Args:
+            actor_label: The label of the actor
+            actor_path: Path to the actor
+            replace: Whether to overwrite a path already recorded for the label
+        """
+        if not replace and actor_label in self._label_cache:
+            return
+        if len(self._label_cache) >= _LOOKUP_CACHE_SIZE:
+            self._label_cache.clear()
+        self._label_cache[actor_label] = actor_path
+        
+    def clear_label_cache(self) -> None:
+        """Forget every cached label lookup, e.g. after a different level is loaded"""
+        self._label_cache.clear()
+        
+    def forget_actor(self, actor_path: str) -> None:
+        """
+        Drop cached label and component lookups for an actor that no longer exists
+        
+        Args:
+            actor_path: Path to the destroyed actor
+        """
+        for label in [label for label, path in list(self._label_cache.items()) if path == actor_path]:
+            self._label_cache.pop(label, None)
+        for key in [key for key in list(self._component_cache) if key[0] == actor_path]:
+            self._component_cache.pop(key, None)
+            
+    def set_component_color(self, component_path: str, color: List[float]) -> bool:
+        """
+        Tint a mesh component by giving it a dynamic instance of the basic
+        shape material and setting its Color parameter
+        
+        Args:
+            component_path: Path to the mesh component
+            color: List of 3 or 4 color values (0.0-1.0)
+            
+        Returns:
+            True if the color was applied, False otherwise
+        """
+        try:
+            create_mat_result = self.send_command(
+                component_path,
+                "CreateDynamicMaterialInstance",
+                DYNAMIC_COLOR_MATERIAL
+            )
+            
+            material_path = create_mat_result.get("ReturnValue", "")
+            if not material_path:
+                return False
+                
+            self.send_command(
+                material_path,
+                "SetVectorParameterValue",
+                color_parameter(color)
+            )
+            return True
+        except Exception as e:
+            logger.error("Error setting component color: %s", e)
+            return False
+            
+    def close(self) -> None:
+        """Close the pooled HTTP connections held by the session"""
+        self.session.close()
+
+def _is_connect_failure(error: requests.exceptions.RequestException) -> bool:
+    """Whether a request failed before it could reach Unreal Engine"""
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    reason = getattr(error.args[0], "reason", None) if error.args else None
+    return isinstance(error, requests.exceptions.ConnectionError) and isinstance(reason, NewConnectionError)
 
 # Global connection instance
 _unreal_connection = None
+_connection_lock = threading.Lock()
 
-def get_unreal_connection():
-    """Get or create a persistent Unreal connection"""
+def get_unreal_connection(skip_probe: bool = True):
+    """
+    Get or create a persistent Unreal connection
+    
+    Args:
+        skip_probe: Return an existing connection without checking it; a dead
+                    connection then shows up as a failed command. A new
+                    connection is always probed.
+    """
     global _unreal_connection
     
-    # If we have an existing connection, check if it's still valid
-    if _unreal_connection is not None:
-        try:
+    # Without a probe there is nothing to wait for, not even a probe running
+    # under the lock in another thread
+    connection = _unreal_connection
+    if skip_probe and connection is not None:
+        return connection
+    
+    # Several tool calls may resolve the connection from worker threads at once
+    with _connection_lock:
+        # If we have an existing connection, check if it's still valid; a
+        # recent successful call is proof enough
+        if _unreal_connection is not None:
+            if skip_probe or time.monotonic() - _unreal_connection.last_success < _LIVENESS_TTL:
+                return _unreal_connection
             if _unreal_connection.test_connection():
                 return _unreal_connection
-        except Exception as e:
+                
             # Connection is dead, create a new one
-            logger.warning(f"Existing connection is no longer valid: {str(e)}")
+            logger.warning("Existing connection is no longer valid")
+            _unreal_connection.close()
             _unreal_connection = None
+        
+        # Create a new connection if needed
+        if _unreal_connection is None:
+            _unreal_connection = UnrealConnection()
+            if not _unreal_connection.test_connection():
+                logger.error("Failed to connect to Unreal Engine")
+                _unreal_connection.close()
+                _unreal_connection = None
+                raise Exception("Could not connect to Unreal Engine. Make sure Unreal Engine is running with Remote Control API enabled.")
+            logger.info("Created new persistent connection to Unreal Engine")
+        
+        return _unreal_connection
+
+def close_unreal_connection() -> None:
+    """Close the persistent Unreal connection, if one is open"""
+    global _unreal_connection
     
-    # Create a new connection if needed
-    if _unreal_connection is None:
-        _unreal_connection = UnrealConnection()
-        if not _unreal_connection.test_connection():
-            logger.error("Failed to connect to Unreal Engine")
+    with _connection_lock:
+        if _unreal_connection is not None:
+            _unreal_connection.close()
             _unreal_connection = None
-            raise Exception("Could not connect to Unreal Engine. Make sure Unreal Engine is running with Remote Control API enabled.")
-        logger.info("Created new persistent connection to Unreal Engine")
-    
-    return _unreal_connection
@@ -1,27 +1,157 @@
 # unreal_mcp_server.py
 # Main entry point for the Unreal Engine MCP server
 
+import functools
+import itertools
 import logging
 import json
+import os
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
-from typing import AsyncIterator, Dict, Any
+from types import MappingProxyType
+from typing import AsyncIterator, Awaitable, Callable, Dict, Any, List, Mapping, Set, Tuple
 import traceback
 
 from mcp.server.fastmcp import FastMCP, Context
 
 # Import our modules
-from unreal_connection import get_unreal_connection
+import unreal_actors
+import unreal_assets
+from unreal_connection import get_unreal_connection, close_unreal_connection
+from unreal_utils import parse_kwargs, parse_vector, encode_json, decode_json
 
-# Import the rest of the modules when needed to avoid circular references
-
-# Configure logging
-logging.basicConfig(level=logging.INFO, 
+# Configure logging; per-command INFO messages are off unless requested, and
+# an unknown level name falls back to WARNING instead of stopping the server
+_log_level_name = (os.environ.get("UNREAL_MCP_LOG_LEVEL") or "WARNING").upper()
+_log_level = getattr(logging, _log_level_name, None)
+logging.basicConfig(level=_log_level if isinstance(_log_level, int) else logging.WARNING, 
                     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("UnrealMCPServer")
+if not isinstance(_log_level, int):
+    logger.warning("Unknown UNREAL_MCP_LOG_LEVEL %r, using WARNING", _log_level_name)
+
+# Worker threads for the blocking Unreal Engine calls made by tools
+_TOOL_WORKERS = 16
+
+# Seconds between background checks that Unreal Engine is reachable
+_HEALTH_INTERVAL = 5.0
+
+# Result of the latest background check; tools that need Unreal Engine fail
+# fast while it is False
+_unreal_healthy = True
+
+# Background tasks started with _spawn_task, cancelled at shutdown
+_background_tasks: Set[asyncio.Task] = set()
 
 # Global spatial context to track all actors
-spatial_context: Dict[str, Dict[str, str]] = {}
+spatial_context: Dict[str, Dict[str, Tuple[float, float, float]]] = {}
+
+# Serialized spatial context returned by get_spatial_context, keyed by whether
+# it is pretty-printed; emptied by any change to spatial_context
+_spatial_context_json: Dict[bool, str] = {}
+
+def _spatial_context_changed() -> None:
+    """Invalidate the serialized spatial context after spatial_context is modified"""
+    _spatial_context_json.clear()
+
+# Numbers unlabeled actors in the spatial context; unlike len(spatial_context)
+# it never hands out the same number twice, even to concurrent spawns
+_actor_seq = itertools.count()
+
+# Transform components assumed for an actor when none are given
+_ZERO_VECTOR = (0.0, 0.0, 0.0)
+_UNIT_VECTOR = (1.0, 1.0, 1.0)
+
+def _vec3(value: Any, default: Tuple[float, float, float]) -> Tuple[float, float, float]:
+    """
+    Convert a vector to the (x, y, z) float tuple stored in the spatial context
+    
+    Args:
+        value: List, "x,y,z" string or Unreal Engine {"X": x, "Y": y, "Z": z} dict
+        default: Tuple to use when value is missing or not a 3-component vector
+    """
+    if isinstance(value, dict):
+        value = list(value.values())
+    elif isinstance(value, str):
+        try:
+            value = parse_vector(value)
+        except ValueError:
+            return default
+    if isinstance(value, (list, tuple)) and len(value) == 3:
+        try:
+            x, y, z = (float(v) for v in value)
+            return (x, y, z)
+        except (TypeError, ValueError):
+            pass
+    return default
+
+def _track_actor(params: Dict[str, Any], default_prefix: str) -> None:
+    """Record the transform of an actor created from params in the spatial context"""
+    actor_label = params.get("actor_label", params.get("name"))
+    if actor_label is None:
+        actor_label = f"{default_prefix}_{next(_actor_seq)}"
+    # Labels such as actor_label=5 parse as numbers; JSON object keys must be strings
+    spatial_context[str(actor_label)] = {
+        "location": _vec3(params.get("location"), _ZERO_VECTOR),
+        "rotation": _vec3(params.get("rotation"), _ZERO_VECTOR),
+        "scale": _vec3(params.get("scale"), _UNIT_VECTOR)
+    }
+    _spatial_context_changed()
+
+def _tool_errors(action: str, needs_unreal: bool = True):
+    """
+    Decorate a tool so exceptions are logged and returned as an error message
+    
+    Args:
+        action: What the tool does, used as "Error <action>: <exception>"
+        needs_unreal: Fail immediately while Unreal Engine is known to be unreachable
+    """
+    error_prefix = f"Error {action}: "
+    unreachable = error_prefix + "Unreal Engine is not reachable, reconnecting in the background"
+    
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            if needs_unreal and not _unreal_healthy:
+                return unreachable
+            try:
+                return await fn(*args, **kwargs)
+            except Exception as e:
+                logger.error("Error in %s: %s", fn.__name__, e)
+                return error_prefix + str(e)
+        return wrapper
+    return decorator
+
+def _spawn_task(coro) -> asyncio.Task:
+    """Start a background task that is cancelled when the server shuts down"""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+async def _health_loop() -> None:
+    """Periodically check that Unreal Engine is reachable, reconnecting if it is not"""
+    global _unreal_healthy
+    while True:
+        # Tools skip the liveness probe, so this loop is what notices a dead
+        # connection; without recent successful calls it is probed and
+        # replaced when the probe fails
+        try:
+            await asyncio.to_thread(get_unreal_connection, skip_probe=False)
+            healthy = True
+        except Exception as e:
+            logger.debug("Unreal Engine health check failed: %s", e)
+            healthy = False
+        
+        if healthy:
+            if not _unreal_healthy:
+                logger.info("Reconnected to Unreal Engine")
+        elif _unreal_healthy:
+            logger.warning("Could not connect to Unreal Engine, retrying in the background")
+        _unreal_healthy = healthy
+        
+        await asyncio.sleep(_HEALTH_INTERVAL)
 
 @asynccontextmanager
 async def server_lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
@@ -30,22 +160,29 @@ async def server_lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
     try:
         logger.info("UnrealMCP server starting up")
         
-        # Try to connect to Unreal Engine on startup
-        try:
-            unreal = get_unreal_connection()
-            if unreal.test_connection():
-                logger.info("Successfully connected to Unreal Engine on startup")
-            else:
-                logger.warning("Could not connect to Unreal Engine on startup")
-        except Exception as e:
-            logger.warning(f"Could not connect to Unreal Engine on startup: {str(e)}")
+        # Tools run their blocking Unreal Engine requests in the default
+        # executor, so size it for several concurrent tool calls
+        asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=_TOOL_WORKERS))
+        
+        # Connect to Unreal Engine and keep checking it without delaying startup
+        _spawn_task(_health_loop())
         
         # Initialize spatial context (could load from Unreal if needed)
         spatial_context = {}
-        yield {}
+        _spatial_context_changed()
+        yield {"spawn": _spawn_task}
     finally:
+        # Cancel background tasks and wait for them before closing the
+        # connection they may be using
+        tasks = list(_background_tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        
+        close_unreal_connection()
         logger.info("UnrealMCP server shut down")
         spatial_context.clear()
+        _spatial_context_changed()
 
 # Create the MCP server with lifespan support
 mcp = FastMCP(
@@ -56,30 +193,35 @@ mcp = FastMCP(
 
 # Tool to get the current spatial context
 @mcp.tool()
-def get_spatial_context(ctx: Context) -> str:
-    """Return the current spatial context of all actors as a JSON string."""
+@_tool_errors("retrieving spatial context", needs_unreal=False)
+async def get_spatial_context(ctx: Context, pretty: bool = False) -> str:
+    """
+    Return the current spatial context of all actors as a JSON string.
+    
+    Parameters:
+    - pretty: Indent the JSON for reading (default: compact)
+    """
     global spatial_context
-    try:
-        return json.dumps(spatial_context, indent=2)
-    except Exception as e:
-        logger.error(f"Error in get_spatial_context: {str(e)}")
-        return f"Error retrieving spatial context: {str(e)}"
+    text = _spatial_context_json.get(pretty)
+    if text is None:
+        text = encode_json(spatial_context, indent=pretty).decode('utf-8')
+        _spatial_context_json[pretty] = text
+    return text
 
 # Tool to reset the spatial context
 @mcp.tool()
-def reset_spatial_context(ctx: Context) -> str:
+@_tool_errors("resetting spatial context", needs_unreal=False)
+async def reset_spatial_context(ctx: Context) -> str:
     """Reset the spatial context, clearing all tracked actors."""
     global spatial_context
-    try:
-        spatial_context.clear()
-        return "Spatial context reset successfully."
-    except Exception as e:
-        logger.error(f"Error in reset_spatial_context: {str(e)}")
-        return f"Error resetting spatial context: {str(e)}"
+    spatial_context.clear()
+    _spatial_context_changed()
+    return "Spatial context reset successfully."
 
 # Modified existing tools to update spatial context
 @mcp.tool()
-def delete_actor(ctx: Context, actor_label: str) -> str:
+@_tool_errors("deleting actor")
+async def delete_actor(ctx: Context, actor_label: str) -> str:
     """
     Delete a specific actor from the Unreal Engine level.
     
@@ -87,17 +229,14 @@ def delete_actor(ctx: Context, actor_label: str) -> str:
     - actor_label: The label/name of the actor to delete
     """
     global spatial_context
-    try:
-        from unreal_actors import delete_actor as del_actor
-        result = del_actor(actor_label)
-        spatial_context.pop(actor_label, None)  # Remove from context
-        return result
-    except Exception as e:
-        logger.error(f"Error in delete_actor: {str(e)}")
-        return f"Error deleting actor: {str(e)}"
+    result = await asyncio.to_thread(unreal_actors.delete_actor, actor_label)
+    spatial_context.pop(str(actor_label), None)  # Remove from context
+    _spatial_context_changed()
+    return result
 
 @mcp.tool()
-def spawn_actor_from_blueprint(ctx: Context, kwargs: str) -> str:
+@_tool_errors("spawning actor from blueprint")
+async def spawn_actor_from_blueprint(ctx: Context, kwargs: str) -> str:
     """
     Spawn a level actor based on an Unreal Blueprint class.
     
@@ -113,24 +252,14 @@ def spawn_actor_from_blueprint(ctx: Context, kwargs: str) -> str:
     - scale: x,y,z scale factors
     """
     global spatial_context
-    try:
-        from unreal_actors import spawn_actor_from_blueprint as spawn_bp
-        result = spawn_bp(kwargs)
-        # Parse kwargs to update spatial context
-        params = dict(kv.split("=") for kv in kwargs.split() if "=" in kv)
-        actor_label = params.get("actor_label", params.get("name", f"Actor_{len(spatial_context)}"))
-        spatial_context[actor_label] = {
-            "location": params.get("location", "0,0,0"),
-            "rotation": params.get("rotation", "0,0,0"),
-            "scale": params.get("scale", "1,1,1")
-        }
-        return result
-    except Exception as e:
-        logger.error(f"Error in spawn_actor_from_blueprint: {str(e)}")
-        return f"Error spawning actor from blueprint: {str(e)}"
+    params = parse_kwargs(kwargs)
+    result = await asyncio.to_thread(unreal_actors.spawn_actor_from_blueprint, params)
+    _track_actor(params, "Actor")
+    return result
 
 @mcp.tool()
-def spawn_static_mesh(ctx: Context, kwargs: str) -> str:
+@_tool_errors("spawning static mesh actor")
+async def spawn_static_mesh(ctx: Context, kwargs: str) -> str:
     """
     Spawn a static mesh actor using an existing static mesh asset from the content browser.
     
@@ -148,23 +277,60 @@ def spawn_static_mesh(ctx: Context, kwargs: str) -> str:
     - color: r,g,b color values (0.0-1.0)
     """
     global spatial_context
-    try:
-        from unreal_actors import spawn_static_mesh_actor_from_mesh
-        result = spawn_static_mesh_actor_from_mesh(kwargs)
-        params = dict(kv.split("=") for kv in kwargs.split() if "=" in kv)
-        actor_label = params.get("actor_label", params.get("name", f"Mesh_{len(spatial_context)}"))
-        spatial_context[actor_label] = {
-            "location": params.get("location", "0,0,0"),
-            "rotation": params.get("rotation", "0,0,0"),
-            "scale": params.get("scale", "1,1,1")
-        }
-        return result
-    except Exception as e:
-        logger.error(f"Error in spawn_static_mesh: {str(e)}")
-        return f"Error spawning static mesh actor: {str(e)}"
+    params = parse_kwargs(kwargs)
+    result = await asyncio.to_thread(unreal_actors.spawn_static_mesh_actor_from_mesh, params)
+    _track_actor(params, "Mesh")
+    return result
+
+@mcp.tool()
+@_tool_errors("spawning actor from blueprint")
+async def spawn_actor_from_blueprint_async(ctx: Context, kwargs: str) -> str:
+    """
+    Start spawning a blueprint actor without waiting for Unreal Engine to finish.
+    Issue several spawns this way, then call finish_spawning to collect the results.
+    
+    Parameters:
+    - kwargs: Same parameters as spawn_actor_from_blueprint
+    
+    Returns a spawn id to pass to finish_spawning.
+    """
+    return await asyncio.to_thread(unreal_actors.spawn_actor_from_blueprint_async, kwargs)
 
 @mcp.tool()
-def create_static_mesh_actor(ctx: Context, kwargs: str) -> str:
+@_tool_errors("spawning static mesh actor")
+async def spawn_static_mesh_async(ctx: Context, kwargs: str) -> str:
+    """
+    Start spawning a static mesh actor without waiting for Unreal Engine to finish.
+    Issue several spawns this way, then call finish_spawning to collect the results.
+    
+    Parameters:
+    - kwargs: Same parameters as spawn_static_mesh
+    
+    Returns a spawn id to pass to finish_spawning.
+    """
+    return await asyncio.to_thread(unreal_actors.spawn_static_mesh_actor_from_mesh_async, kwargs)
+
+@mcp.tool()
+@_tool_errors("finishing spawns", needs_unreal=False)
+async def finish_spawning(ctx: Context, spawn_id: str = None) -> str:
+    """
+    Wait for spawns started with the *_async tools and return their results.
+    
+    Parameters:
+    - spawn_id: Optional spawn id to wait for; waits for every pending spawn if omitted
+    """
+    global spatial_context
+    results = await asyncio.to_thread(unreal_actors.finish_spawning, spawn_id)
+    
+    # Only spawns that succeeded are recorded in the spatial context
+    for spawn in results:
+        if spawn.message.startswith("Successfully"):
+            _track_actor(spawn.params, spawn.label_prefix)
+    return "\n".join(spawn.message for spawn in results)
+
+@mcp.tool()
+@_tool_errors("creating static mesh actor")
+async def create_static_mesh_actor(ctx: Context, kwargs: str) -> str:
     """
     Create a new static mesh actor in the Unreal Engine level using a simpler approach.
     
@@ -181,23 +347,54 @@ def create_static_mesh_actor(ctx: Context, kwargs: str) -> str:
     - color: r,g,b color values (0.0-1.0)
     """
     global spatial_context
-    try:
-        from unreal_actors import create_static_mesh_actor as create_mesh
-        result = create_mesh(kwargs)
-        params = dict(kv.split("=") for kv in kwargs.split() if "=" in kv)
-        actor_label = params.get("actor_label", params.get("name", f"Mesh_{len(spatial_context)}"))
-        spatial_context[actor_label] = {
-            "location": params.get("location", "0,0,0"),
-            "rotation": params.get("rotation", "0,0,0"),
-            "scale": params.get("scale", "1,1,1")
-        }
-        return result
-    except Exception as e:
-        logger.error(f"Error in create_static_mesh_actor: {str(e)}")
-        return f"Error creating static mesh actor: {str(e)}"
+    params = parse_kwargs(kwargs)
+    result = await asyncio.to_thread(unreal_actors.create_static_mesh_actor, params)
+    _track_actor(params, "Mesh")
+    return result
+
+@mcp.tool()
+@_tool_errors("creating static mesh actors")
+async def batch_spawn_static_mesh(ctx: Context, kwargs_list: str) -> str:
+    """
+    Create many static mesh actors at once using a few batched requests to Unreal Engine.
+    
+    Prefer this over calling create_static_mesh_actor repeatedly when placing more
+    than a handful of actors.
+    
+    Parameters:
+    - kwargs_list: JSON array with one object per actor, each taking the same
+      parameters as create_static_mesh_actor
+      Example: '[{"actor_label": "Cube1", "mesh_type": "CUBE", "location": [0, 0, 0]},
+                 {"actor_label": "Ball1", "mesh_type": "SPHERE", "location": [200, 0, 0]}]'
+                 
+    Returns a JSON array with one result message per actor, in input order.
+    """
+    global spatial_context
+    specs = decode_json(kwargs_list)
+    if not isinstance(specs, list):
+        return "Error: kwargs_list must be a JSON array of parameter objects"
+        
+    # Entries that are neither objects nor key=value strings would parse as
+    # empty parameters and spawn a default cube, so they fail on their own
+    results = ["Error: each entry must be a parameter object or key=value string"] * len(specs)
+    valid = []
+    for index, spec in enumerate(specs):
+        if not isinstance(spec, (dict, str)):
+            continue
+        try:
+            valid.append((index, parse_kwargs(spec)))
+        except ValueError as e:
+            results[index] = f"Error creating static mesh actor: {str(e)}"
+    created = await asyncio.to_thread(unreal_actors.create_static_mesh_actors, [params for _, params in valid])
+    for (index, params), result in zip(valid, created):
+        results[index] = result
+        if result.startswith("Successfully"):
+            _track_actor(params, "Mesh")
+    return encode_json(results).decode('utf-8')
 
 @mcp.tool()
-def modify_actor(ctx: Context, kwargs: str) -> str:
+@_tool_errors("modifying actor")
+async def modify_actor(ctx: Context, kwargs: str) -> str:
     """
     Modify an existing actor in the Unreal Engine level.
     
@@ -214,53 +411,52 @@ def modify_actor(ctx: Context, kwargs: str) -> str:
     - color: r,g,b color values (0.0-1.0)
     """
     global spatial_context
-    try:
-        from unreal_actors import modify_actor as mod_actor
-        result = mod_actor(kwargs)
-        params = dict(kv.split("=") for kv in kwargs.split() if "=" in kv)
-        actor_label = params["actor_label"]
-        if actor_label in spatial_context:
-            spatial_context[actor_label].update({
-                k: params[k] for k in ["location", "rotation", "scale"] if k in params
-            })
-        return result
-    except Exception as e:
-        logger.error(f"Error in modify_actor: {str(e)}")
-        return f"Error modifying actor: {str(e)}"
+    params = parse_kwargs(kwargs)
+    result = await asyncio.to_thread(unreal_actors.modify_actor, params)
+    actor_label = str(params.get("actor_label"))
+    if actor_label in spatial_context:
+        entry = spatial_context[actor_label]
+        entry.update({
+            k: _vec3(params[k], entry[k]) for k in ["location", "rotation", "scale"] if k in params
+        })
+        _spatial_context_changed()
+    return result
 
 @mcp.tool()
-def get_level_info(ctx: Context) -> str:
+@_tool_errors("getting level info")
+async def get_level_info(ctx: Context) -> str:
     """Get information about the current Unreal Engine level and update spatial context."""
     global spatial_context
+    level_info = await asyncio.to_thread(unreal_assets.get_level_info)  # Get the level info from Unreal Engine
+    
+    # Assuming level_info is a JSON string or similar format with actor data
+    # If it's not JSON, you'd need to adjust the parsing logic accordingly
     try:
-        from unreal_assets import get_level_info as get_level
-        level_info = get_level()  # Get the level info from Unreal Engine
-        
-        # Assuming level_info is a JSON string or similar format with actor data
-        # If it's not JSON, you'd need to adjust the parsing logic accordingly
-        try:
-            level_data = json.loads(level_info)  # Parse the level info if it's JSON
-            if isinstance(level_data, dict) and "actors" in level_data:
-                # Clear existing spatial context and update with new actor data
-                spatial_context.clear()
-                for actor in level_data["actors"]:
-                    actor_label = actor.get("actor_label", actor.get("name", f"Actor_{len(spatial_context)}"))
-                    spatial_context[actor_label] = {
-                        "location": actor.get("location", "0,0,0"),
-                        "rotation": actor.get("rotation", "0,0,0"),
-                        "scale": actor.get("scale", "1,1,1")
-                    }
-        except json.JSONDecodeError:
-            # If level_info isn't JSON or doesn't contain actor data, just return it as-is
-            logger.info("Level info not in expected JSON format, spatial context unchanged")
-        
-        return level_info  # Return the original level info string
-    except Exception as e:
-        logger.error(f"Error in get_level_info: {str(e)}")
-        return f"Error getting level info: {str(e)}"
+        level_data = decode_json(level_info)  # Parse the level info if it's JSON
+        if isinstance(level_data, dict) and "actors" in level_data:
+            # Build the new spatial context aside and swap it in at once, so
+            # concurrent tools never see a partially rebuilt context
+            new_context = {}
+            for index, actor in enumerate(level_data["actors"]):
+                actor_label = actor.get("actor_label", actor.get("name", actor.get("label")))
+                if actor_label is None:
+                    actor_label = f"Actor_{index}"
+                new_context[actor_label] = {
+                    "location": _vec3(actor.get("location"), _ZERO_VECTOR),
+                    "rotation": _vec3(actor.get("rotation"), _ZERO_VECTOR),
+                    "scale": _vec3(actor.get("scale"), _UNIT_VECTOR)
+                }
+            spatial_context = new_context
+            _spatial_context_changed()
+    except json.JSONDecodeError:
+        # If level_info isn't JSON or doesn't contain actor data, just return it as-is
+        logger.info("Level info not in expected JSON format, spatial context unchanged")
+    
+    return level_info  # Return the original level info string
 
 @mcp.tool()
-def list_available_assets(ctx: Context, kwargs: str) -> str:
+@_tool_errors("listing available assets")
+async def list_available_assets(ctx: Context, kwargs: str) -> str:
     """
     List available assets of a specific type in the Unreal Engine project.
     
@@ -274,30 +470,22 @@ def list_available_assets(ctx: Context, kwargs: str) -> str:
     - search_term: Optional term to filter results
     - max_results: Maximum number of results to return (default: 20)
     """
-    try:
-        from unreal_assets import get_available_assets
-        return get_available_assets(kwargs)
-    except Exception as e:
-        logger.error(f"Error in list_available_assets: {str(e)}")
-        return f"Error listing available assets: {str(e)}"
+    return await asyncio.to_thread(unreal_assets.get_available_assets, kwargs)
 
 @mcp.tool()
-def get_actor_info(ctx: Context, actor_label: str) -> str:
+@_tool_errors("getting actor info")
+async def get_actor_info(ctx: Context, actor_label: str) -> str:
     """
     Get detailed information about a specific actor in the Unreal Engine level.
     
     Parameters:
     - actor_label: The label/name of the actor to get information about
     """
-    try:
-        from unreal_actors import get_actor_info as get_info
-        return get_info(actor_label)
-    except Exception as e:
-        logger.error(f"Error in get_actor_info: {str(e)}")
-        return f"Error getting actor info: {str(e)}"
+    return await asyncio.to_thread(unreal_actors.get_actor_info, actor_label)
 
 @mcp.tool()
-def search_assets_recursively(ctx: Context, base_path: str, asset_type: str = None, search_term: str = None, max_results: int = 50) -> str:
+@_tool_errors("searching assets recursively")
+async def search_assets_recursively(ctx: Context, base_path: str, asset_type: str = None, search_term: str = None, max_results: int = 50) -> str:
     """
     Search for assets recursively in all common subdirectories.
     
@@ -307,12 +495,113 @@ def search_assets_recursively(ctx: Context, base_path: str, asset_type: str = No
     - search_term: Optional search term to filter results
     - max_results: Maximum number of results (default: 50)
     """
-    try:
-        from unreal_assets import search_assets_recursively as search_assets
-        return search_assets(base_path, asset_type, search_term, max_results)
-    except Exception as e:
-        logger.error(f"Error in search_assets_recursively: {str(e)}")
-        return f"Error searching assets recursively: {str(e)}"
+    return await asyncio.to_thread(unreal_assets.search_assets_recursively, base_path, asset_type, search_term, max_results)
+
+def _call_failed(result: Any) -> bool:
+    """Whether a tool result reports an error"""
+    return isinstance(result, str) and result.startswith(("Error", "INVALID_ARGUMENT"))
+
+async def _run_batched_tool(ctx: Context, call: Dict[str, Any]) -> str:
+    """Run one batch_call entry and return its result"""
+    # Tools report their own exceptions as error messages
+    return await _BATCH_TOOLS[call["tool"]](ctx, **call.get("args", {}))
+
+@mcp.tool()
+@_tool_errors("running batch", needs_unreal=False)
+async def batch_call(ctx: Context, calls_json: str) -> str:
+    """
+    Run several tools in one request, e.g. spawn an actor, modify it, then read its info.
+    
+    Parameters:
+    - calls_json: JSON array of calls, each an object with:
+      - id: Optional name for the call (defaults to its position in the array)
+      - tool: Name of the tool to run
+      - args: Object with the tool's parameters
+      - input_from: Optional id or list of ids of earlier calls that must succeed first
+      Example: '[{"id": "spawn", "tool": "create_static_mesh_actor", "args": {"kwargs": "actor_label=Cube"}},
+                 {"tool": "get_actor_info", "args": {"actor_label": "Cube"}, "input_from": "spawn"}]'
+                 
+    Calls whose dependencies have all finished run concurrently. A call is skipped
+    with an INVALID_ARGUMENT result if it is malformed (not an object, a repeated
+    id, an unknown tool or args that are not an object) or if one of its
+    dependencies failed.
+    Returns a JSON array of {"id", "result"} objects in input order.
+    """
+    calls = decode_json(calls_json)
+    if not isinstance(calls, list):
+        return "Error: calls_json must be a JSON array of calls"
+        
+    # Group the calls into layers: a call runs one layer after its latest
+    # dependency, and dependencies must appear earlier in the array. Calls
+    # rejected up front count as layer -1, so dependents are skipped in layer 0
+    layer_of: Dict[str, int] = {}
+    layers: List[List[Dict[str, Any]]] = []
+    results: Dict[str, str] = {}
+    # Entries rejected without claiming an id (not an object, or a repeated
+    # id), by array position
+    rejected: Dict[int, str] = {}
+    ids: List[str] = []
+    for index, call in enumerate(calls):
+        if not isinstance(call, dict):
+            ids.append(str(index))
+            rejected[index] = "INVALID_ARGUMENT: each call must be an object"
+            continue
+        call["id"] = str(call.get("id", index))
+        ids.append(call["id"])
+        if call["id"] in layer_of:
+            rejected[index] = f"INVALID_ARGUMENT: duplicate call id '{call['id']}'"
+            continue
+            
+        deps = call.get("input_from")
+        if deps is None:
+            deps = []
+        elif not isinstance(deps, (list, tuple)):
+            deps = [deps]
+        call["input_from"] = [str(dep) for dep in deps]
+        unknown = [dep for dep in call["input_from"] if dep not in layer_of]
+        if call.get("tool") not in _BATCH_TOOLS:
+            results[call["id"]] = f"INVALID_ARGUMENT: unknown tool '{call.get('tool')}'"
+            layer = -1
+        elif not isinstance(call.get("args", {}), dict):
+            results[call["id"]] = "INVALID_ARGUMENT: args must be an object"
+            layer = -1
+        elif unknown:
+            results[call["id"]] = f"INVALID_ARGUMENT: input_from references unknown or later call '{unknown[0]}'"
+            layer = -1
+        else:
+            layer = max((layer_of[dep] + 1 for dep in call["input_from"]), default=0)
+            if layer == len(layers):
+                layers.append([])
+            layers[layer].append(call)
+        layer_of[call["id"]] = layer
+        
+    for layer in layers:
+        runnable = []
+        for call in layer:
+            failed = [dep for dep in call["input_from"] if _call_failed(results[dep])]
+            if failed:
+                results[call["id"]] = f"INVALID_ARGUMENT: dependency '{failed[0]}' failed"
+            else:
+                runnable.append(call)
+        for call, result in zip(runnable, await asyncio.gather(*(_run_batched_tool(ctx, call) for call in runnable))):
+            results[call["id"]] = result
+            
+    return encode_json([
+        {"id": call_id, "result": rejected[index] if index in rejected else results[call_id]}
+        for index, call_id in enumerate(ids)
+    ]).decode('utf-8')
+
+# Tools that batch_call may run, by name; read-only so the whitelist is fixed
+# once the module is loaded
+_BATCH_TOOLS: Mapping[str, Callable[..., Awaitable[str]]] = MappingProxyType({
+    tool.__name__: tool for tool in (
+        get_spatial_context, reset_spatial_context, delete_actor,
+        spawn_actor_from_blueprint, spawn_static_mesh,
+        spawn_actor_from_blueprint_async, spawn_static_mesh_async, finish_spawning,
+        create_static_mesh_actor, batch_spawn_static_mesh, modify_actor,
+        get_level_info, list_available_assets, get_actor_info, search_assets_recursively
+    )
+})
 
 if __name__ == "__main__":
     try:
@@ -321,5 +610,5 @@ if __name__ == "__main__":
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
     except Exception as e:
-        logger.error(f"Error running UnrealMCP server: {str(e)}")
+        logger.error("Error running UnrealMCP server: %s", e)
         traceback.print_exc()
\ No newline at end of file
@@ -1,15 +1,43 @@
 # unreal_utils.py
 # Utility functions for the Unreal MCP server
 
+import functools
 import json
 import logging
-from typing import Dict, Any, List, Union, Optional, Tuple
+import os
+import re
+from types import MappingProxyType
+from typing import Dict, Any, List, Sequence, Union, Optional, Tuple
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, 
-                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+# orjson is optional; fall back to the standard library parser without it
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
+# Indent JSON tool results for reading them while debugging
+_PRETTY_RESULTS = os.environ.get("UNREAL_MCP_PRETTY") == "1"
+
+# Logging is configured by the entry point (unreal_mcp_server.py)
 logger = logging.getLogger("UnrealUtils")
 
+# A key=value token; the value runs to the next whitespace and may itself contain '='
+_KV_RE = re.compile(r'([^\s=]+)=(\S*)')
+
+# Boolean spellings accepted in key=value strings (matched case-insensitively)
+_BOOLEANS = {'true': True, 'false': False}
+
+# Decimal numbers with optional sign and exponent; words like "inf" or "nan"
+# stay strings. The integer group is set only for numbers without a fraction
+_NUMBER_RE = re.compile(r'[-+]?(?:(?P<integer>\d+)|\d+\.\d*|\.\d+)(?P<exponent>[eE][-+]?\d+)?')
+
+# Actor types recognised in object names, tried in order so the more specific
+# names win wherever they appear (SkyLight before Light, and StaticMeshActor
+# before Light for "LightStaticMeshActor_1")
+_ACTOR_TYPES = ('StaticMeshActor', 'SkyAtmosphere', 'SkyLight', 'VolumetricCloud', 'PlayerStart', 'Light', 'Fog')
+
 def parse_kwargs(kwargs_str) -> Dict[str, Any]:
     """
     Parse kwargs from string, dict, or JSON format to a unified dictionary.
@@ -20,34 +48,56 @@ def parse_kwargs(kwargs_str) -> Dict[str, Any]:
     Returns:
         Dictionary of parsed parameters
     """
-    if not kwargs_str:
-        return {}
-    
-    # If it's already a dictionary, return it
+    # If it's already a dictionary, return it (the common case from internal callers)
     if isinstance(kwargs_str, dict):
         return kwargs_str
+    
+    if not kwargs_str:
+        return {}
         
     # Check if it's a JSON string
     if isinstance(kwargs_str, str):
         if kwargs_str.strip().startswith('{') and kwargs_str.strip().endswith('}'):
             try:
-                return json.loads(kwargs_str)
+                # orjson.JSONDecodeError is a subclass of json.JSONDecodeError
+                kwargs = _json_loads(kwargs_str)
             except json.JSONDecodeError:
-                logger.warning(f"Failed to parse as JSON: {kwargs_str}")
+                logger.warning("Failed to parse as JSON: %s", kwargs_str)
                 # Continue with key=value parsing
+            else:
+                # Vectors sent as "x,y,z" strings get the same conversion as key=value input
+                for key, value in kwargs.items():
+                    if key in VECTOR_KEYS and isinstance(value, str) and ',' in value:
+                        kwargs[key] = parse_vector(value)
+                return kwargs
     
-    # Parse as space-separated key=value pairs
-    kwargs = {}
-    
+    # Parse as space-separated key=value pairs; callers may modify the result,
+    # so each call gets fresh lists from the cached parse
     if isinstance(kwargs_str, str):
-        parts = kwargs_str.split()
-        
-        for part in parts:
-            if '=' in part:
-                key, value = part.split('=', 1)
-                kwargs[key] = parse_value(key, value)
+        return {
+            key: list(value) if isinstance(value, tuple) else value
+            for key, value in _parse_kv_pairs(kwargs_str)
+        }
     
-    return kwargs
+    return {}
+
+@functools.lru_cache(maxsize=256)
+def _parse_kv_pairs(kwargs_str: str) -> Tuple[Tuple[str, Any], ...]:
+    """
+    Parse a string of key=value pairs, caching the result for repeated strings.
+    
+    Args:
+        kwargs_str: Space-separated key=value pairs
+        
+    Returns:
+        Tuple of (key, value) pairs, with vectors stored as tuples
+    """
+    pairs = {}
+    for match in _KV_RE.finditer(kwargs_str):
+        key, value = match.groups()
+        value = parse_value(key, value)
+        pairs[key] = tuple(value) if isinstance(value, list) else value
+    return tuple(pairs.items())
 
 def parse_value(key: str, value: str) -> Any:
     """
@@ -61,54 +111,92 @@ def parse_value(key: str, value: str) -> Any:
         Parsed value in appropriate type
     """
     # Parse vectors (location, rotation, scale, color)
-    if ',' in value and key in ['location', 'rotation', 'scale', 'color', 'material_color']:
-        return [float(x) for x in value.split(',')]
+    if ',' in value and key in VECTOR_KEYS:
+        return parse_vector(value)
     
     # Parse booleans
-    if value.lower() == 'true':
-        return True
-    if value.lower() == 'false':
-        return False
-    
-    # Parse numbers
-    if value.isdigit():
-        return int(value)
-    if value.replace('.', '', 1).isdigit():
+    boolean = _BOOLEANS.get(value.lower())
+    if boolean is not None:
+        return boolean
+    
+    # Parse numbers, as int unless there is a fraction or exponent
+    number = _NUMBER_RE.fullmatch(value)
+    if number:
+        if number.group('integer') and not number.group('exponent'):
+            return int(value)
         return float(value)
     
     # Default to string
     return value
 
-def vector_to_ue_format(vector: List[float], keys: List[str] = None) -> Dict[str, float]:
+def parse_vector(value: str) -> List[float]:
+    """
+    Parse a comma-separated string such as "100,200,50" into a list of floats.
+    
+    Args:
+        value: Comma-separated numbers
+        
+    Returns:
+        List of float values
+    """
+    return [float(x) for x in value.split(',')]
+
+# Component names of Unreal Engine vectors and rotators
+_VECTOR_COMPONENTS = ("X", "Y", "Z")
+_ROTATOR_COMPONENTS = ("Pitch", "Yaw", "Roll")
+
+# Transform parameters and the components each is converted to
+_TRANSFORM_COMPONENTS = (
+    ('location', _VECTOR_COMPONENTS),
+    ('rotation', _ROTATOR_COMPONENTS),
+    ('scale', _VECTOR_COMPONENTS),
+)
+
+def vector_to_ue_format(vector: List[float], keys: Sequence[str] = _VECTOR_COMPONENTS) -> Dict[str, float]:
     """
     Convert a vector list [x, y, z] to Unreal Engine format {"X": x, "Y": y, "Z": z}
     or with custom keys.
     
     Args:
         vector: List of float values
-        keys: Optional list of custom keys (default: ["X", "Y", "Z"])
+        keys: Optional sequence of custom keys (default: "X", "Y", "Z")
         
     Returns:
         Dictionary in Unreal Engine format
     """
-    if not keys:
-        keys = ["X", "Y", "Z"]
-        
-    if not isinstance(vector, list) or len(vector) < len(keys):
+    if not isinstance(vector, (list, tuple)) or len(vector) < len(keys):
         # Return default values if vector is invalid
         return {k: 0.0 if k != "A" else 1.0 for k in keys}
     
-    # Ensure all values are floats
-    result = {}
-    for i, k in enumerate(keys):
-        if i < len(vector):
-            result[k] = float(vector[i])
-        elif k == "A":  # Default alpha to 1.0
-            result[k] = 1.0
-        else:
-            result[k] = 0.0
-            
-    return result
+    # Ensure all values are floats; the vector has a value for every key
+    return {k: float(v) for k, v in zip(keys, vector)}
+
+def color_to_ue_format(color: List[float]) -> Dict[str, float]:
+    """
+    Convert a color list [r, g, b] or [r, g, b, a] to Unreal Engine
+    LinearColor format, defaulting alpha to 1.0.
+    
+    Args:
+        color: List of 3 or 4 color values (0.0-1.0)
+        
+    Returns:
+        Dictionary with "R", "G", "B" and "A" keys
+    """
+    r, g, b, *rest = color
+    return {"R": r, "G": g, "B": b, "A": rest[0] if rest else 1.0}
+
+def color_parameter(color: List[float]) -> Dict[str, Any]:
+    """
+    Build the SetVectorParameterValue parameters that color a dynamic
+    material instance of BASIC_SHAPE_MATERIAL.
+    
+    Args:
+        color: List of 3 or 4 color values (0.0-1.0)
+        
+    Returns:
+        Dictionary with the parameter name and LinearColor value
+    """
+    return {"ParameterName": "Color", "Value": color_to_ue_format(color)}
 
 def format_transform_params(params: Dict[str, Any]) -> Dict[str, Dict[str, float]]:
     """
@@ -121,21 +209,14 @@ def format_transform_params(params: Dict[str, Any]) -> Dict[str, Dict[str, float
         Dictionary with formatted location, rotation, and scale
     """
     result = {}
+    if params.keys().isdisjoint(TRANSFORM_KEYS):
+        return result
     
-    # Format location
-    location = params.get('location')
-    if location:
-        result['location'] = vector_to_ue_format(location)
-    
-    # Format rotation
-    rotation = params.get('rotation')
-    if rotation:
-        result['rotation'] = vector_to_ue_format(rotation, ["Pitch", "Yaw", "Roll"])
-    
-    # Format scale
-    scale = params.get('scale')
-    if scale:
-        result['scale'] = vector_to_ue_format(scale)
+    # Format location, rotation and scale
+    for key, components in _TRANSFORM_COMPONENTS:
+        value = params.get(key)
+        if value:
+            result[key] = vector_to_ue_format(value, components)
     
     return result
 
@@ -152,7 +233,23 @@ def get_common_actor_name(params: Dict[str, Any], default_name: str = "NewActor"
     """
     return params.get('actor_label') or params.get('name') or params.get('label') or default_name
 
-def validate_required_params(params: Dict[str, Any], required_keys: List[str]) -> Tuple[bool, str]:
+@functools.lru_cache(maxsize=4096)
+def infer_actor_type(actor_path: str) -> str:
+    """
+    Infer an actor's type from the object name at the end of its path.
+    
+    Results are cached, as every level listing classifies the same paths again.
+    
+    Args:
+        actor_path: Path to the actor, e.g. "/Game/Map.Map:PersistentLevel.PointLight_0"
+        
+    Returns:
+        Actor type such as "StaticMeshActor" or "Light", or "Unknown"
+    """
+    object_name = actor_path.rsplit('.', 1)[-1]
+    return next((actor_type for actor_type in _ACTOR_TYPES if actor_type in object_name), "Unknown")
+
+def validate_required_params(params: Dict[str, Any], required_keys: Sequence[str]) -> Tuple[bool, str]:
     """
     Validate that required parameters are present.
     
@@ -170,8 +267,73 @@ def validate_required_params(params: Dict[str, Any], required_keys: List[str]) -
     
     return True, ""
 
+def encode_json(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize an object to JSON bytes, compact unless indent is set.
+    
+    Uses orjson when it is installed and the standard library otherwise.
+    
+    Args:
+        obj: JSON-serializable object
+        indent: Pretty-print with an indent of two spaces
+        
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    if indent:
+        return json.dumps(obj, indent=2).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+def encode_result(obj: Any) -> str:
+    """
+    Serialize a tool result to JSON text for the MCP client.
+    
+    Results are compact, since they are read by a model rather than a
+    person; set UNREAL_MCP_PRETTY=1 to indent them while debugging.
+    
+    Args:
+        obj: JSON-serializable result
+        
+    Returns:
+        JSON string
+    """
+    return encode_json(obj, indent=_PRETTY_RESULTS).decode('utf-8')
+
+def decode_json(data: Union[bytes, str]) -> Any:
+    """
+    Parse JSON text, such as a response body received from Unreal Engine.
+    
+    Uses orjson when it is installed and the standard library otherwise.
+    
+    Args:
+        data: Raw JSON bytes or a string
+        
+    Returns:
+        The decoded object
+    """
+    return _json_loads(data)
+
+# Parameter keys whose values are comma-separated vectors (x,y,z or r,g,b)
+VECTOR_KEYS = frozenset(['location', 'rotation', 'scale', 'color', 'material_color'])
+
+# Parameter keys read by format_transform_params
+TRANSFORM_KEYS = frozenset(['location', 'rotation', 'scale'])
+
+# Editor objects that serve the level and asset queries
+EDITOR_ACTOR_SUBSYSTEM = "/Script/UnrealEd.Default__EditorActorSubsystem"
+EDITOR_ASSET_LIBRARY = "/Script/EditorScriptingUtilities.Default__EditorAssetLibrary"
+
+# Material used for dynamically colored basic shapes
+BASIC_SHAPE_MATERIAL = "/Engine/BasicShapes/BasicShapeMaterial.BasicShapeMaterial"
+
+# CreateDynamicMaterialInstance parameters for a colorable instance of it in
+# the first material slot; never modified, so every request shares the dict
+DYNAMIC_COLOR_MATERIAL = {"ElementIndex": 0, "SourceMaterial": BASIC_SHAPE_MATERIAL}
+
 # Common subdirectories in Unreal Engine projects for asset searches
-COMMON_SUBDIRS = [
+COMMON_SUBDIRS = (
     "",  # Base directory itself
     "/Blueprints",
     "/Meshes", 
@@ -181,24 +343,30 @@ COMMON_SUBDIRS = [
     "/FX",
     "/Audio",
     "/Animations"
-]
+)
 
-# Map of basic shapes to their asset paths
-BASIC_SHAPES = {
+# Map of basic shapes to their asset paths (read-only, shared by every caller)
+BASIC_SHAPES = MappingProxyType({
     "CUBE": "/Engine/BasicShapes/Cube.Cube",
     "SPHERE": "/Engine/BasicShapes/Sphere.Sphere",
     "CYLINDER": "/Engine/BasicShapes/Cylinder.Cylinder",
     "PLANE": "/Engine/BasicShapes/Plane.Plane",
     "CONE": "/Engine/BasicShapes/Cone.Cone"
-}
-
-# Asset type identifiers for searching
-ASSET_TYPE_IDENTIFIERS = {
-    'blueprint': ['/blueprint', '/blueprints', 'bp_', '_bp'],
-    'staticmesh': ['/mesh', '/meshes', '/staticmesh', '/staticmeshes', 'sm_', '_sm'],
-    'material': ['/material', '/materials', 'mat_', '_mat', 'm_'],
-    'texture': ['/texture', '/textures', 't_', '_t'],
-    'sound': ['/sound', '/sounds', '/audio', 's_', '_s'],
-    'particle': ['/fx', '/effect', '/effects', '/particle', '/particles', 'fx_', 'p_', '_p'],
-    'animation': ['/anim', '/animation', '/animations', 'a_', '_a'],
-}
+})
+
+# Asset type identifiers for searching (read-only, shared by every caller)
+ASSET_TYPE_IDENTIFIERS = MappingProxyType({
+    'blueprint': ('/blueprint', '/blueprints', 'bp_', '_bp'),
+    'staticmesh': ('/mesh', '/meshes', '/staticmesh', '/staticmeshes', 'sm_', '_sm'),
+    'material': ('/material', '/materials', 'mat_', '_mat', 'm_'),
+    'texture': ('/texture', '/textures', 't_', '_t'),
+    'sound': ('/sound', '/sounds', '/audio', 's_', '_s'),
+    'particle': ('/fx', '/effect', '/effects', '/particle', '/particles', 'fx_', 'p_', '_p'),
+    'animation': ('/anim', '/animation', '/animations', 'a_', '_a'),
+})
+
+# One case-insensitive pattern per asset type, matching any of its identifiers
+ASSET_TYPE_PATTERNS = MappingProxyType({
+    asset_type: re.compile('|'.join(map(re.escape, identifiers)), re.IGNORECASE)
+    for asset_type, identifiers in ASSET_TYPE_IDENTIFIERS.items()
+})